@@ -276,8 +276,6 @@ def run_app():
         sys.stderr = open(os.devnull, "w", encoding="utf-8", errors="replace")
 
     # Re-invoke main's __main__ logic
-    sys.excepthook = main.show_crash_dialog
-
     import argparse
     parser = argparse.ArgumentParser(description="AirPoint")
     parser.add_argument("--profile", type=str, default=None)
@@ -285,21 +283,20 @@ def run_app():
     parser.add_argument("--dwell", action="store_true")
     parser.add_argument("--skip-update", action="store_true")
     parser.add_argument("--generate-default", action="store_true")
+    main._add_runtime_args(parser)   # --infer-every, --camera, ... (same as main.py)
     args = parser.parse_args()
 
     if args.generate_default:
-        import json
         os.makedirs(main.PROFILES_DIR, exist_ok=True)
         path = os.path.join(main.PROFILES_DIR, "default.json")
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(main.DEFAULT_CONFIG, f, indent=2)
+        main._write_json(path, main.DEFAULT_CONFIG)
         raise SystemExit(0)
 
+    # Installed only after the --generate-default exit (see main.py).
+    sys.excepthook = main.show_crash_dialog
+
     try:
-        gaze = not args.no_gaze
-        controller = main.HandCenterGestureController(enable_gaze_detection=gaze)
-        if args.dwell:
-            controller.dwell_click_enabled = True
+        controller = main._controller_from_args(args)
         if args.profile:
             if not controller.load_profile(args.profile):
                 # Profile didn't exist or failed to load. Keep the name so a save
@@ -78,9 +78,9 @@ def analyse(path, jitter_only=False):
         print("\n-- Latency (software pipeline, ms) --")
         print(f"  total   : mean {st.mean(total):6.1f}  median {st.median(total):6.1f}  "
               f"p95 {_pct(total,95):6.1f}  max {max(total):6.1f}")
-        print(f"  capture : mean {st.mean(cap):6.1f}   (camera read + flip)")
-        print(f"  inference mean {st.mean(inf):6.1f}   (BGR->RGB + MediaPipe — the dominant cost)")
-        print(f"  post    : mean {st.mean(post):6.1f}   (gesture + mapping + cursor move)")
+        print(f"  capture : mean {st.mean(cap):6.1f}   (camera read -> inference start, on the capture thread)")
+        print(f"  inference mean {st.mean(inf):6.1f}   (MediaPipe hands + gaze — the dominant cost)")
+        print(f"  post    : mean {st.mean(post):6.1f}   (wait for the tick + gesture + mapping + cursor move)")
 
         print("\n-- Frame rate --")
         print(f"  {fps:.1f} FPS (mean over the run)")
@@ -25,8 +25,40 @@ import copy
 import argparse
 import traceback
 import logging
-from datetime import datetime
+import threading
 from collections import deque
+from datetime import datetime
+
+# orjson is optional: profile (de)serialization is ~10x faster with it, and the
+# stdlib json fallback (see _write_json) writes the same indent=2 UTF-8 JSON.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# numba is optional too: when installed, the small per-frame gesture kernels
+# (see "Gesture kernels") are JIT-compiled; without it they run as plain Python
+# with identical results.
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def njit(*args, **kwargs):
+    """numba.njit when numba is installed, else a no-op decorator. A failure to
+    set up compilation (e.g. no cache locator inside a frozen bundle) also falls
+    back to the plain function instead of breaking the import."""
+    def deco(func):
+        if numba is None:
+            return func
+        try:
+            return numba.njit(**kwargs)(func)
+        except Exception:
+            return func
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return deco(args[0])
+    return deco
 
 # Force UTF-8 stdout/stderr so the emoji debug prints below don't raise
 # UnicodeEncodeError on a cp1252 (charmap) console - the default on Windows.
@@ -90,6 +122,33 @@ _WINDOWS_RESERVED_NAMES = {
     *(f"LPT{i}" for i in range(1, 10)),
 }
 
+
+def _read_json(path):
+    """Parse a JSON file, via orjson when available."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_json(path, obj):
+    """Write obj to path as indent=2 JSON, via orjson when available.
+    Falls back to stdlib json for values orjson refuses (e.g. non-str keys)."""
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            data = None
+        if data is not None:
+            with open(path, "wb") as f:
+                f.write(data)
+            return
+    # ensure_ascii=False: orjson writes non-ASCII (accented / CJK profile
+    # names) as-is, so the same profile serializes the same either way.
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(obj, f, indent=2, ensure_ascii=False)
+
 # ---------- Crash logging ----------
 
 def _write_crash_log(exc_type, exc_value, exc_tb):
@@ -109,11 +168,21 @@ def _write_crash_log(exc_type, exc_value, exc_tb):
 
 
 def show_crash_dialog(exc_type, exc_value, exc_tb):
-    """Show a user-friendly PyQt5 error dialog and log the crash."""
+    """Show a user-friendly PyQt5 error dialog and log the crash.
+    When running from source with no QApplication up yet (CLI-only paths) the
+    traceback is just printed - spinning up Qt only to show a modal adds
+    seconds to an already-failing process. Frozen builds have no console, so
+    there the dialog is the only way the user ever sees the error.
+    """
     _write_crash_log(exc_type, exc_value, exc_tb)
     try:
         from PyQt5.QtWidgets import QApplication, QMessageBox
-        app = QApplication.instance() or QApplication(sys.argv)
+        app = QApplication.instance()
+        if app is None:
+            if not FROZEN:
+                traceback.print_exception(exc_type, exc_value, exc_tb)
+                return
+            app = QApplication(sys.argv)
         apply_app_theme(app)
         msg = QMessageBox()
         msg.setIcon(QMessageBox.Critical)
@@ -937,12 +1006,32 @@ QScrollBar::handle:vertical {{ background: {t.border_strong}; border-radius: 5px
 QScrollBar::handle:vertical:hover {{ background: {t.text_dim}; }}
 QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{ height: 0; }}
 QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{ background: transparent; }}
+/* Setup-wizard calibration widgets. Their looks change with a dynamic property
+   (see _set_qss_state) instead of a fresh per-widget stylesheet each time. */
+QLabel#stepDot {{ background-color: {t.border}; border-radius: 7px; }}
+QLabel#stepDot[state="done"] {{ background-color: {t.accent}; }}
+QLabel#stepDot[state="current"] {{ background-color: {t.accent}; border: 2px solid {t.text}; }}
+QLabel#calHint {{ color: {t.accent}; }}
+QLabel#calHint[tone="danger"] {{ color: {t.danger}; }}
 """
 
 
 BASE_QSS = _build_base_qss(T)
 
 
+def _set_qss_state(widget, name, value):
+    """Set a dynamic property that BASE_QSS rules select on, and re-polish the
+    widget so the matching rule applies. setStyleSheet() on the widget would
+    re-parse a stylesheet every time; this only re-matches the existing one.
+    A no-op when the value is unchanged."""
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
 def apply_app_theme(app):
     """Apply the resolved theme to a QApplication: Fusion base (so Windows and
     macOS render the same clean, Mac-like styling), matching palette for native
@@ -1203,6 +1292,35 @@ def _app_icon():
     return QIcon(pix)
 
 
+# Hand skeleton bones as (start, end) landmark index pairs.
+_HAND_BONES = np.array(sorted(mp.solutions.hands.HAND_CONNECTIONS), dtype=np.intp)
+
+# MediaPipe handedness label of an unmirrored frame -> the selfie-view label.
+_SWAPPED_HAND = {"Left": "Right", "Right": "Left"}
+
+
+def _draw_hand(frame, hand_landmarks, joint_spec, bone_spec):
+    """Drop-in for mp_draw.draw_landmarks(frame, hand_landmarks,
+    HAND_CONNECTIONS, joint_spec, bone_spec) with the same look. MediaPipe's
+    version converts and bounds-checks every landmark in Python and issues a
+    separate cv2.line per bone; here the pixel coordinates come from one
+    vectorized pass and all the bones go out in a single cv2.polylines call."""
+    h, w = frame.shape[:2]
+    points = hand_landmarks.landmark
+    px = np.empty((len(points), 2))
+    px[:, 0] = [lm.x for lm in points]
+    px[:, 1] = [lm.y for lm in points]
+    px *= (w, h)
+    px = px.astype(np.int32)
+    cv2.polylines(frame, px[_HAND_BONES], False, bone_spec.color, bone_spec.thickness)
+    # White border ring, then the joint itself - as mediapipe draws them.
+    r = joint_spec.circle_radius
+    border = max(r + 1, int(r * 1.2))
+    for x, y in px.tolist():
+        cv2.circle(frame, (x, y), border, (224, 224, 224), joint_spec.thickness)
+        cv2.circle(frame, (x, y), r, joint_spec.color, joint_spec.thickness)
+
+
 class CameraWidget(QLabel):
     """QLabel subclass that displays OpenCV BGR frames."""
 
@@ -1211,13 +1329,53 @@ class CameraWidget(QLabel):
         self.setFixedSize(width, height)
         self.setAlignment(Qt.AlignCenter)
         self.setStyleSheet(f"background-color: {T.camera_bg}; border-radius: 10px;")
-
-    def update_frame(self, cv_frame):
-        rgb = cv2.cvtColor(cv_frame, cv2.COLOR_BGR2RGB)
-        h, w, ch = rgb.shape
-        q_img = QImage(rgb.data, w, h, ch * w, QImage.Format_RGB888)
-        scaled = q_img.scaled(self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self.setPixmap(QPixmap.fromImage(scaled))
+        # Widget-sized frame buffers (plain + mirrored) with QImages wrapping
+        # them, and one QPixmap they're converted into - all allocated on the
+        # first frame (or a size change) and then reused every update.
+        self._size = None
+        self._bufs = None
+        self._qimgs = None
+        self._pixmap = QPixmap()
+
+    # Qt >= 5.14 reads OpenCV's BGR byte order directly, which saves a full
+    # color-swap pass on every update.
+    _BGR888 = getattr(QImage, "Format_BGR888", None)
+
+    def _alloc(self, size):
+        w, h = size
+        self._size = size
+        self._bufs = (np.empty((h, w, 3), dtype=np.uint8), np.empty((h, w, 3), dtype=np.uint8))
+        fmt = self._BGR888 if self._BGR888 is not None else QImage.Format_RGB888
+        # The QImages don't copy: self._bufs must outlive them (it does).
+        self._qimgs = tuple(QImage(b.data, w, h, b.strides[0], fmt) for b in self._bufs)
+
+    def update_frame(self, cv_frame, mirror=False):
+        """Scale cv_frame into the widget (keeping its aspect) and show it.
+        mirror=True flips it horizontally for display; that's applied after
+        scaling, so it touches the (smaller) widget-sized image instead of
+        costing a cv2.flip pass over the full camera frame.
+        """
+        h, w = cv_frame.shape[:2]
+        scale = min(self.width() / w, self.height() / h)
+        size = (max(1, round(w * scale)), max(1, round(h * scale)))
+        if size != self._size:
+            self._alloc(size)
+        buf, mirror_buf = self._bufs
+        # OpenCV's resize into the preallocated buffer replaces QImage.scaled(),
+        # which allocated a new image per frame; INTER_AREA is both cheap and
+        # clean at these fixed 2-3x downscales.
+        if size == (w, h):
+            np.copyto(buf, cv_frame)
+        else:
+            cv2.resize(cv_frame, size, dst=buf, interpolation=cv2.INTER_AREA)
+        out = 0
+        if mirror:
+            cv2.flip(buf, 1, dst=mirror_buf)
+            out = 1
+        if self._BGR888 is None:
+            cv2.cvtColor(self._bufs[out], cv2.COLOR_BGR2RGB, dst=self._bufs[out])
+        self._pixmap.convertFromImage(self._qimgs[out])
+        self.setPixmap(self._pixmap)
 
 
 class CameraPreview(QWidget):
@@ -1252,8 +1410,8 @@ class CameraPreview(QWidget):
         self.status.setStyleSheet(
             f"background-color: {bg}; color: {fg}; border-radius: 10px; padding: 6px;")
 
-    def show_frame(self, cv_frame):
-        self.view.update_frame(cv_frame)
+    def show_frame(self, cv_frame, mirror=False):
+        self.view.update_frame(cv_frame, mirror=mirror)
 
     def set_hand(self, label):
         """label is mediapipe's 'Left'/'Right' for the controlling hand, or None."""
@@ -1268,6 +1426,18 @@ class CameraPreview(QWidget):
             self._set_status_style(T.surface, T.text_dim)
 
 
+# Calibration reach directions, in capture order, with their instruction
+# string keys and the direction names shown in the hint for languages that
+# translate them (others show the English name).
+_CAL_DIRECTIONS = ("LEFT", "RIGHT", "UP", "DOWN")
+_CAL_MOVE_KEYS = ("cal_move_left", "cal_move_right", "cal_move_up", "cal_move_down")
+_CAL_DIR_BY_LANG = {
+    "hi": ("बाईं ओर", "दाईं ओर", "ऊपर", "नीचे"),
+    "ml": ("ഇടത്", "വലത്", "മുകൾ", "താഴ്"),
+    "ta": ("இடது", "வலது", "மேல்", "கீழ்"),
+}
+
+
 class SetupWizard(QWidget):
     """PyQt5 setup wizard for profile selection and calibration."""
 
@@ -1286,9 +1456,14 @@ class SetupWizard(QWidget):
         self.cal_step = 0
         self.dir_index = 0
         self.recorded = {}
+        self._recorded_px = []        # recorded points in frame pixels (cached)
+        self._recorded_px_key = None
         self.capture_countdown = None
         self.tremor_start = None
-        self.tremor_samples = []
+        # Hand centers for the 5 s steadiness hold, one row per 33 ms tick
+        # (plus slack); _tremor_n rows are filled.
+        self.tremor_samples = np.empty((int(5.0 / 0.033) + 5, 2))
+        self._tremor_n = 0
         self.gesture_sampling = False
         self.gesture_sample_start = None
         self.gesture_samples = []
@@ -1313,10 +1488,22 @@ class SetupWizard(QWidget):
         # Camera widget (shared across calibration sub-steps)
         self.camera_widget = CameraWidget(640, 360)
 
-        # Timer for calibration camera loop
+        # Timer for calibration camera loop. Single-shot and re-armed at the end
+        # of each tick for whatever is left of the 33 ms frame budget, so a slow
+        # hands.process() just stretches one tick instead of having the next
+        # one fire the instant it returns, starving the event loop.
         self.timer = QTimer()
-        self.timer.setInterval(33)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
         self.timer.timeout.connect(self._on_timer_tick)
+        self._cal_running = False
+        # Camera + hand inference thread, only while calibrating (see
+        # _start_calibration / _stop_cal_timer).
+        self._grabber = None
+        self._frame_seq = 0
+        # Subdued hand skeleton for the calibration preview, built once.
+        self._landmark_spec = self.controller.mp_draw.DrawingSpec(color=(80, 80, 80), thickness=1, circle_radius=1)
+        self._conn_spec = self.controller.mp_draw.DrawingSpec(color=(60, 60, 60), thickness=1)
 
         # Build pages
         self.stacked.addWidget(self._build_language_page())    # 0
@@ -1325,6 +1512,11 @@ class SetupWizard(QWidget):
         self.stacked.addWidget(self._build_welcome_page())     # 3
         self.stacked.addWidget(self._build_calibration_page()) # 4
         self.stacked.addWidget(self._build_done_page())        # 5
+        # Every page except the live calibration one is static once built: let
+        # Qt keep their painted contents across resizes / page switches and
+        # only repaint newly exposed areas.
+        for idx in (0, 1, 2, 3, 5):
+            self.stacked.widget(idx).setAttribute(Qt.WA_StaticContents, True)
 
         # Show correct starting page
         if self.controller.profile_name and self.controller.calibration is None:
@@ -1683,7 +1875,7 @@ class SetupWizard(QWidget):
         for i in range(4):
             dot = QLabel()
             dot.setFixedSize(14, 14)
-            dot.setStyleSheet(f"background-color: {T.border}; border-radius: 7px;")
+            dot.setObjectName("stepDot")
             self.step_dots.append(dot)
             dots_row.addWidget(dot)
         dots_row.addStretch()
@@ -1715,7 +1907,7 @@ class SetupWizard(QWidget):
         self.cal_hint = QLabel(S("cal_hint_dir", dir="LEFT"))
         self.cal_hint.setFont(_font(16, QFont.Bold))
         self.cal_hint.setAlignment(Qt.AlignCenter)
-        self.cal_hint.setStyleSheet(f"color: {T.accent};")
+        self.cal_hint.setObjectName("calHint")
         vbox.addWidget(self.cal_hint)
 
         # Progress bar (hidden by default)
@@ -1865,16 +2057,51 @@ class SetupWizard(QWidget):
         self.recorded = {}
         self.capture_countdown = None
         self.tremor_start = None
-        self.tremor_samples = []
+        self._tremor_n = 0
         self.gesture_results = {}
         self._update_cal_display()
         self.stacked.setCurrentIndex(4)
-        self.timer.start()
+        self._cal_running = True
+        self._frame_seq = 0
+        self._infer_count = 0
+        self._last_hand_results = None
+        self._grabber = _FrameGrabber(self.controller.cap,
+                                      infer=self._infer_hands)
+        self._grabber.use_opencl = self.controller._grabber.use_opencl
+        self._grabber.start()
+        self.timer.start(0)
+
+    # While just waiting for SPACE / N the hand model only has to feed the
+    # live preview, so it runs on every 3rd frame and the result in between is
+    # reused. Anything that samples the hand (a direction hold, the steadiness
+    # step, gesture recording) gets every frame - a reused result would count
+    # as a duplicate sample there.
+    IDLE_INFER_EVERY = 3
+
+    def _infer_hands(self, rgb):
+        """hands.process for the wizard's grabber thread (see IDLE_INFER_EVERY).
+        Only reads the step flags, which the GUI thread owns."""
+        sampling = (self.cal_step == 1 or self.gesture_sampling
+                    or self.capture_countdown is not None)
+        self._infer_count += 1
+        if (not sampling and self._last_hand_results is not None
+                and self._infer_count % self.IDLE_INFER_EVERY):
+            return self._last_hand_results
+        self._last_hand_results = self.controller.hands.process(rgb)
+        return self._last_hand_results
+
+    def _stop_cal_timer(self):
+        """Stop the calibration loop and release the camera to the caller."""
+        self._cal_running = False
+        self.timer.stop()
+        if self._grabber is not None:
+            self._grabber.stop()
+            self._grabber = None
 
     def _start_limited(self):
         """Accessibility bypass: create an uncalibrated profile that runs in
         Limited mode (move + flick-click, any hand pose) - no pinch/fist needed."""
-        self.timer.stop()
+        self._stop_cal_timer()
         c = self.controller
         c.limited_mode = True
         c.kids_mode = False
@@ -1896,7 +2123,7 @@ class SetupWizard(QWidget):
     def _start_kids(self):
         """Accessibility bypass: create an uncalibrated profile that runs in Kids
         mode (open hand = move, close = click, hover edge = scroll) - no pinch/fist."""
-        self.timer.stop()
+        self._stop_cal_timer()
         c = self.controller
         c.kids_mode = True
         c.limited_mode = False
@@ -1919,40 +2146,19 @@ class SetupWizard(QWidget):
         self._finish("completed")
 
     def _update_cal_display(self):
-        DIRECTIONS = ["LEFT", "RIGHT", "UP", "DOWN"]
-        GESTURE_NAMES = ["Pinch", "Fist"]
-
         # Update step dots
-        step_map = {0: 0, 1: 1, 2: 2, 3: 3}
-        current = step_map.get(self.cal_step, 0)
+        current = self.cal_step
         for i, dot in enumerate(self.step_dots):
-            if i < current:
-                dot.setStyleSheet(f"background-color: {T.accent}; border-radius: 7px;")
-            elif i == current:
-                dot.setStyleSheet(f"background-color: {T.accent}; border-radius: 7px; border: 2px solid {T.text};")
-            else:
-                dot.setStyleSheet(f"background-color: {T.border}; border-radius: 7px;")
+            _set_qss_state(dot, "state", "done" if i < current else
+                           "current" if i == current else "todo")
 
         if self.cal_step == 0:
-            d = DIRECTIONS[self.dir_index] if self.dir_index < 4 else "DOWN"
+            d = min(self.dir_index, 3)   # past the last one: keep showing DOWN
             self.cal_title.setText(S("cal_step1_title"))
-            inst_map = {
-                "LEFT": S("cal_move_left"),
-                "RIGHT": S("cal_move_right"),
-                "UP": S("cal_move_up"),
-                "DOWN": S("cal_move_down"),
-            }
-            self.cal_instruction.setText(inst_map.get(d, ""))
-            # For Hindi, direction names stay in the hint via {dir}
-            dir_display = {"LEFT": "LEFT", "RIGHT": "RIGHT", "UP": "UP", "DOWN": "DOWN"}
-            _dir_by_lang = {
-                "hi": {"LEFT": "बाईं ओर", "RIGHT": "दाईं ओर", "UP": "ऊपर", "DOWN": "नीचे"},
-                "ml": {"LEFT": "ഇടത്", "RIGHT": "വലത്", "UP": "മുകൾ", "DOWN": "താഴ്"},
-                "ta": {"LEFT": "இடது", "RIGHT": "வலது", "UP": "மேல்", "DOWN": "கீழ்"},
-            }
-            if _current_lang in _dir_by_lang:
-                dir_display = _dir_by_lang[_current_lang]
-            self.cal_hint.setText(S("cal_hint_dir", dir=dir_display.get(d, d)))
+            self.cal_instruction.setText(S(_CAL_MOVE_KEYS[d]))
+            # Direction names in the hint go through {dir}, translated if we can
+            names = _CAL_DIR_BY_LANG.get(_current_lang, _CAL_DIRECTIONS)
+            self.cal_hint.setText(S("cal_hint_dir", dir=names[d]))
             self.cal_progress.setVisible(False)
         elif self.cal_step == 1:
             self.cal_title.setText(S("cal_step2_title"))
@@ -1980,43 +2186,69 @@ class SetupWizard(QWidget):
     # ---- Timer Tick (Camera + Calibration Logic) ----
 
     def _on_timer_tick(self):
+        t0 = time.perf_counter()
         try:
-            ret, frame = self.controller.cap.read()
-            if not ret:
-                return
-            frame = cv2.flip(frame, 1)
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            hand_results = self.controller.hands.process(rgb_frame)
+            # Capture, downscale and hands.process() all happen on the grabber's
+            # thread; the GUI thread only draws and runs the calibration steps.
+            latest = self._grabber.latest() if self._grabber is not None else None
+            if latest is None or latest[0] == self._frame_seq:
+                # ~2s of failed reads, or of hands.process raising (nothing is
+                # published then, so it would otherwise wait here forever).
+                if self._grabber is not None and (self._grabber.fail_count >= 60
+                                                  or self._grabber.infer_fail_count >= 60):
+                    self._camera_lost()
+                return   # no new frame since the last tick
+            # The frame is NOT flipped: the widget mirrors it for display
+            # (after downscaling), and the landmarks are mirrored below, so
+            # calibration still sees the same selfie-view coordinates as tracking.
+            self._frame_seq, _t_cap, frame, hand_results = latest
             frame_h, frame_w = frame.shape[:2]
 
             hand_center = None
             landmarks = None
-            if hand_results.multi_hand_landmarks:
-                # If more than one hand is visible (e.g. a helper's), calibrate on
-                # the most-centered one so a stray hand can't corrupt the capture.
-                def _centered(hl):
-                    ctr = self.controller.calculate_hand_center(self.controller.get_landmarks(hl))
-                    return (ctr[0] - 0.5) ** 2 + (ctr[1] - 0.5) ** 2
-                hl = min(hand_results.multi_hand_landmarks, key=_centered)
-                self.controller.mp_draw.draw_landmarks(
-                    frame, hl, self.controller.mp_hands.HAND_CONNECTIONS,
-                    self.controller.mp_draw.DrawingSpec(color=(80, 80, 80), thickness=1, circle_radius=1),
-                    self.controller.mp_draw.DrawingSpec(color=(60, 60, 60), thickness=1)
-                )
-                landmarks = self.controller.get_landmarks(hl)
-                hand_center = self.controller.calculate_hand_center(landmarks)
-                hx = int(hand_center[0] * frame_w)
+            hls = hand_results.multi_hand_landmarks
+            if hls:
+                c = self.controller
+                if len(hls) == 1:
+                    hl = hls[0]
+                    landmarks = c.get_landmarks(hl)
+                    hand_center = c.calculate_hand_center(landmarks)
+                else:
+                    # More than one hand visible (e.g. a helper's): calibrate on
+                    # the most-centered one so a stray hand can't corrupt the
+                    # capture. (Distance from the image center is the same
+                    # mirrored or not.) Each hand's landmarks are extracted once.
+                    def _offcenter(cand):
+                        ctr = cand[2]
+                        return (ctr[0] - 0.5) ** 2 + (ctr[1] - 0.5) ** 2
+                    cands = []
+                    for h in hls:
+                        lm = c.get_landmarks(h)
+                        cands.append((h, lm, c.calculate_hand_center(lm)))
+                    hl, landmarks, hand_center = min(cands, key=_offcenter)
+                _draw_hand(frame, hl, self._landmark_spec, self._conn_spec)
+                landmarks[:, 0] = 1.0 - landmarks[:, 0]
+                hand_center[0] = 1.0 - hand_center[0]
+                # Drawn on the unmirrored frame, so map x back.
+                hx = int((1.0 - hand_center[0]) * frame_w)
                 hy = int(hand_center[1] * frame_h)
-                cv2.circle(frame, (hx, hy), 20, (0, 220, 200), 3)
-                cv2.circle(frame, (hx, hy), 5, (0, 220, 200), -1)
-
-            # Draw recorded direction points
-            for rec_label, rec_pos in self.recorded.items():
-                rx = int(rec_pos[0] * frame_w)
-                ry = int(rec_pos[1] * frame_h)
-                cv2.circle(frame, (rx, ry), 12, (0, 200, 120), -1)
-
-            self.camera_widget.update_frame(frame)
+                # LINE_4: the cheapest rasterizer; these markers are never
+                # anti-aliased (cv2's default is LINE_8), so it looks the same.
+                cv2.circle(frame, (hx, hy), 20, (0, 220, 200), 3, cv2.LINE_4)
+                cv2.circle(frame, (hx, hy), 5, (0, 220, 200), -1, cv2.LINE_4)
+
+            # Draw recorded direction points. They never move once captured, so
+            # their pixel positions are only recomputed when one is added (or
+            # the calibration restarts) - not converted again every frame.
+            key = (len(self.recorded), frame_w, frame_h)
+            if key != self._recorded_px_key:
+                self._recorded_px_key = key
+                self._recorded_px = [(int((1.0 - p[0]) * frame_w), int(p[1] * frame_h))
+                                     for p in self.recorded.values()]
+            for pt in self._recorded_px:
+                cv2.circle(frame, pt, 12, (0, 200, 120), -1, cv2.LINE_4)
+
+            self.camera_widget.update_frame(frame, mirror=True)
 
             # Dispatch to step handler
             if self.cal_step == 0:
@@ -2039,17 +2271,23 @@ class SetupWizard(QWidget):
             _write_crash_log(type(e), e, e.__traceback__)
             self._cal_error_count = getattr(self, '_cal_error_count', 0) + 1
             if self._cal_error_count >= 60:  # ~2s of consecutive failures
-                self.timer.stop()
-                try:
-                    QMessageBox.warning(self, "AirPoint",
-                        "AirPoint lost the camera during setup. Reconnect it (or "
-                        "close any app using it) and start setup again.")
-                except Exception:
-                    pass
-                self._finish("quit")
+                self._camera_lost()
+        finally:
+            if self._cal_running:
+                spent_ms = (time.perf_counter() - t0) * 1000.0
+                self.timer.start(max(0, int(33 - spent_ms)))
+
+    def _camera_lost(self):
+        self._stop_cal_timer()
+        try:
+            QMessageBox.warning(self, "AirPoint",
+                "AirPoint lost the camera during setup. Reconnect it (or "
+                "close any app using it) and start setup again.")
+        except Exception:
+            pass
+        self._finish("quit")
 
     def _tick_movement(self, hand_center):
-        DIRECTIONS = ["LEFT", "RIGHT", "UP", "DOWN"]
         HOLD_TIME = 1.0
 
         if self.dir_index >= 4:
@@ -2060,23 +2298,23 @@ class SetupWizard(QWidget):
         if self._space and self.capture_countdown is None and hand_center is not None:
             self.capture_countdown = time.time()
             self.cal_hint.setText(S("cal_hold_still"))
-            self.cal_hint.setStyleSheet(f"color: {T.accent}; font-weight: bold;")
+            _set_qss_state(self.cal_hint, "tone", "accent")
 
         if self.capture_countdown is not None:
             elapsed = time.time() - self.capture_countdown
             if elapsed >= HOLD_TIME:
                 if hand_center is not None:
-                    label = DIRECTIONS[self.dir_index]
+                    label = _CAL_DIRECTIONS[self.dir_index]
                     self.recorded[label] = hand_center
                     print(f"  Captured {label}: ({hand_center[0]:.4f}, {hand_center[1]:.4f})")
                     self.dir_index += 1
                     self.capture_countdown = None
-                    self.cal_hint.setStyleSheet(f"color: {T.accent}; font-weight: bold;")
+                    _set_qss_state(self.cal_hint, "tone", "accent")
                     self._update_cal_display()
                 else:
                     self.capture_countdown = None
                     self.cal_hint.setText(S("cal_hand_lost"))
-                    self.cal_hint.setStyleSheet(f"color: {T.danger}; font-weight: bold;")
+                    _set_qss_state(self.cal_hint, "tone", "danger")
 
     def _tick_steadiness(self, hand_center):
         TREMOR_DURATION = 5.0
@@ -2085,7 +2323,9 @@ class SetupWizard(QWidget):
             if self.tremor_start is None:
                 self.tremor_start = time.time()
             elapsed = time.time() - self.tremor_start
-            self.tremor_samples.append(hand_center)
+            if self._tremor_n < len(self.tremor_samples):
+                self.tremor_samples[self._tremor_n] = hand_center
+                self._tremor_n += 1
 
             progress = min(1.0, elapsed / TREMOR_DURATION)
             self.cal_progress.setValue(int(progress * 100))
@@ -2096,16 +2336,15 @@ class SetupWizard(QWidget):
         else:
             if self.tremor_start is not None:
                 self.tremor_start = None
-                self.tremor_samples.clear()
+                self._tremor_n = 0
                 self.cal_progress.setValue(0)
             self.cal_hint.setText(S("cal_show_hand"))
-            self.cal_hint.setStyleSheet(f"color: {T.danger}; font-weight: bold;")
+            _set_qss_state(self.cal_hint, "tone", "danger")
 
     def _finish_steadiness(self):
-        if len(self.tremor_samples) >= 10:
-            xs = [s[0] for s in self.tremor_samples]
-            ys = [s[1] for s in self.tremor_samples]
-            tremor_std = float(np.sqrt(np.std(xs)**2 + np.std(ys)**2))
+        if self._tremor_n >= 10:
+            # Per-axis std in one reduction, combined as a 2-D magnitude.
+            tremor_std = float(np.hypot(*self.tremor_samples[:self._tremor_n].std(axis=0)))
         else:
             tremor_std = 0.005
 
@@ -2114,13 +2353,10 @@ class SetupWizard(QWidget):
         clamped = max(MIN_STD, min(MAX_STD, tremor_std))
         t = (clamped - MIN_STD) / (MAX_STD - MIN_STD)
         self.controller.smoothing_factor = MIN_SMOOTH + t * (MAX_SMOOTH - MIN_SMOOTH)
-        self.controller.smoothed_screen_pos = None
-        self.controller._smoothed_pass2 = None
-        self.controller._prev_raw_pos = None
-        self.controller._last_output_pos = None
+        self.controller._reset_smoothing()
         self.tremor_std = tremor_std
 
-        print(f"  Tremor STD: {tremor_std:.5f} ({len(self.tremor_samples)} samples)")
+        print(f"  Tremor STD: {tremor_std:.5f} ({self._tremor_n} samples)")
         print(f"  Auto smoothing_factor: {self.controller.smoothing_factor:.2f}")
 
         self.cal_step = 2
@@ -2134,9 +2370,7 @@ class SetupWizard(QWidget):
             if gesture_name == "PINCH":
                 measured_value = self.controller.calculate_distance(landmarks[4], landmarks[8])
             else:  # FIST
-                palm_center = landmarks[9]
-                dists = [self.controller.calculate_distance(landmarks[tip], palm_center) for tip in [4, 8, 12, 16, 20]]
-                measured_value = float(np.mean(dists))
+                measured_value = self.controller.fingertip_palm_distance(landmarks)
 
         if self._n_key and not self.gesture_sampling:
             self.gesture_skipped = True
@@ -2152,7 +2386,7 @@ class SetupWizard(QWidget):
             self.cal_progress.setVisible(True)
             self.cal_progress.setValue(0)
             self.cal_hint.setText(S("cal_recording"))
-            self.cal_hint.setStyleSheet(f"color: {T.accent}; font-weight: bold;")
+            _set_qss_state(self.cal_hint, "tone", "accent")
 
         if self.gesture_sampling and self.gesture_sample_start is not None:
             elapsed = time.time() - self.gesture_sample_start
@@ -2177,11 +2411,11 @@ class SetupWizard(QWidget):
                     self.gesture_samples = []
                     self.cal_progress.setVisible(False)
                     self.cal_hint.setText(S("cal_gesture_retry"))
-                    self.cal_hint.setStyleSheet(f"color: {T.danger}; font-weight: bold;")
+                    _set_qss_state(self.cal_hint, "tone", "danger")
 
     def _advance_from_gesture(self, gesture_name):
         self.cal_progress.setVisible(False)
-        self.cal_hint.setStyleSheet(f"color: {T.accent}; font-weight: bold;")
+        _set_qss_state(self.cal_hint, "tone", "accent")
         if gesture_name == "PINCH":
             self.cal_step = 3
             self._update_cal_display()
@@ -2190,7 +2424,7 @@ class SetupWizard(QWidget):
             self._finish_calibration()
 
     def _finish_calibration(self):
-        self.timer.stop()
+        self._stop_cal_timer()
 
         # Set personal thresholds
         pinch_raw = self.gesture_results.get("PINCH")
@@ -2210,20 +2444,18 @@ class SetupWizard(QWidget):
             print("  Fist: DISABLED")
 
         tremor_std = getattr(self, 'tremor_std', 0.005)
+        # Ordered here, before it's assigned: the controller caches its mapping
+        # per calibration dict, so the dict isn't edited after assignment.
+        x_a, x_b = self.recorded["LEFT"][0], self.recorded["RIGHT"][0]
+        y_a, y_b = self.recorded["UP"][1], self.recorded["DOWN"][1]
         self.controller.calibration = {
-            "left":   self.recorded["LEFT"][0],
-            "right":  self.recorded["RIGHT"][0],
-            "top":    self.recorded["UP"][1],
-            "bottom": self.recorded["DOWN"][1],
+            "left":   min(x_a, x_b),
+            "right":  max(x_a, x_b),
+            "top":    min(y_a, y_b),
+            "bottom": max(y_a, y_b),
             "tremor_std": tremor_std,
             "calibration_margin": self.controller.calibration_margin,
         }
-        if self.controller.calibration["left"] > self.controller.calibration["right"]:
-            self.controller.calibration["left"], self.controller.calibration["right"] = \
-                self.controller.calibration["right"], self.controller.calibration["left"]
-        if self.controller.calibration["top"] > self.controller.calibration["bottom"]:
-            self.controller.calibration["top"], self.controller.calibration["bottom"] = \
-                self.controller.calibration["bottom"], self.controller.calibration["top"]
 
         self.controller.save_profile()
         print(f"Calibration complete for '{self.profile_name}'!")
@@ -2234,7 +2466,7 @@ class SetupWizard(QWidget):
     # ---- Finish / Close ----
 
     def _finish(self, result):
-        self.timer.stop()
+        self._stop_cal_timer()
         self.result = result
         # Apply autostart preference
         if result == "completed" and hasattr(self, 'autostart_cb'):
@@ -2253,7 +2485,7 @@ class SetupWizard(QWidget):
             self._finish("quit")
 
     def closeEvent(self, event):
-        self.timer.stop()
+        self._stop_cal_timer()
         if self.result is None:
             self.result = "quit"
         event.accept()
@@ -2280,6 +2512,13 @@ class HomePage(QWidget):
         "safety_disabled": "panel_look_screen",
         "idle": "panel_ready",
     }
+    # Badge colours (theme attribute names) by keyword in the gesture name,
+    # first match wins; anything else gets the accent. Matched once per
+    # gesture name - there are only a handful - then looked up in _tone_cache.
+    _BADGE_TONES = (("drag", ("drag_soft", "drag")),
+                    ("scroll", ("scroll_soft", "scroll")),
+                    ("safety", ("warn_soft", "warn")))
+    _tone_cache = {}
 
     def __init__(self, controller, parent=None):
         super().__init__(parent)
@@ -2376,6 +2615,13 @@ class HomePage(QWidget):
         v.addStretch(1)
 
     def _set_badge(self, bg, fg, border=None):
+        # Called on every 200 ms status refresh; setStyleSheet re-parses and
+        # re-polishes the label even when the sheet is identical, so only apply
+        # a change (same idea as _cheat_sig below).
+        sig = (bg, fg, border)
+        if sig == getattr(self, "_badge_sig", None):
+            return
+        self._badge_sig = sig
         self.status_badge.setStyleSheet(
             f"background-color: {bg}; color: {fg};"
             f" border: 1px solid {border or bg}; border-radius: 12px; padding: 8px;")
@@ -2401,14 +2647,13 @@ class HomePage(QWidget):
                 self.status_badge.setText("Hold to click...")
             else:
                 self.status_badge.setText(S(self._FRIENDLY.get(gesture, "panel_ready")))
-            bg, fg = T.accent_soft, T.accent
-            if "drag" in gesture.lower():
-                bg, fg = T.drag_soft, T.drag
-            elif "scroll" in gesture.lower():
-                bg, fg = T.scroll_soft, T.scroll
-            elif "safety" in gesture.lower():
-                bg, fg = T.warn_soft, T.warn
-            self._set_badge(bg, fg)
+            tone = self._tone_cache.get(gesture)
+            if tone is None:
+                g = gesture.lower()
+                tone = next((t for k, t in self._BADGE_TONES if k in g),
+                            ("accent_soft", "accent"))
+                self._tone_cache[gesture] = tone
+            self._set_badge(getattr(T, tone[0]), getattr(T, tone[1]))
         self._refresh_cheatsheet()
 
     def _toggle_camera(self):
@@ -3269,6 +3514,7 @@ class MainWindow(QWidget):
         self.timer = QTimer()
         self.timer.setInterval(200)
         self.timer.timeout.connect(self._update_status)
+        self._status_sig = None   # controller state last reflected, see _update_status
 
         self._build_tray()
 
@@ -3289,6 +3535,21 @@ class MainWindow(QWidget):
         self.activateWindow()
 
     def _update_status(self):
+        # Runs 5x a second but the state behind it changes a few times a
+        # minute; each pass re-sets a dozen labels, switches and sliders, and
+        # every setText/setValue can trigger a relayout. So only refresh when
+        # something the three targets show has actually changed.
+        c = self.controller
+        ga = getattr(c, "gesture_actions", {}) or {}
+        sig = (c.profile_name, bool(getattr(c, "paused", False)),
+               getattr(c, "_last_gesture", "no_hand"), _current_lang,
+               bool(getattr(c, "limited_mode", False)), bool(getattr(c, "kids_mode", False)),
+               bool(c.gaze_detection_enabled), bool(c.dwell_click_enabled),
+               getattr(c, "limited_click_sensitivity", 6), getattr(c, "kids_click_hold", 1.2),
+               ga.get("pinch"), ga.get("fist"))
+        if sig == self._status_sig:
+            return
+        self._status_sig = sig
         self.home_page.update_status()
         self.modes_page.sync_from_controller()
         self._update_tray_labels()
@@ -3582,6 +3843,451 @@ class ClickFeedbackOverlay(QWidget):
                 pass
 
 
+# ---------- Gesture kernels ----------
+# Pure-numeric per-frame hand-pose math, kept free of Python objects so numba
+# can compile it. Landmarks are the (21, 2) normalized array from get_landmarks.
+
+_POSE_PINCH = 1 << 5   # bits 0-4 are the finger states (thumb..pinky)
+_POSE_FIST = 1 << 6
+
+
+@njit(cache=True)
+def _finger_bits(lm):
+    """Extended-finger bitmask, bit i = finger i (thumb..pinky). Same tests as
+    count_extended_fingers: the thumb must reach clearly further from the wrist
+    than its own joint; the other fingers just need the tip above the PIP."""
+    wx = lm[0, 0]
+    wy = lm[0, 1]
+    dx = lm[4, 0] - wx
+    dy = lm[4, 1] - wy
+    tip_sq = dx * dx + dy * dy
+    dx = lm[3, 0] - wx
+    dy = lm[3, 1] - wy
+    # tip > pip + 0.03  <=>  tip^2 > (pip + 0.03)^2 (both sides >= 0)
+    reach = math.sqrt(dx * dx + dy * dy) + 0.03
+    bits = 1 if tip_sq > reach * reach else 0
+    for i in range(1, 5):
+        # tips 8/12/16/20, PIPs 6/10/14/18
+        if lm[4 * i + 4, 1] < lm[4 * i + 2, 1] + 0.01:
+            bits |= 1 << i
+    return bits
+
+
+@njit(cache=True)
+def _classify_pose(lm, pinch_active, pinch_threshold, fist_threshold):
+    """Per-frame pose classifier: finger bits | _POSE_PINCH | _POSE_FIST.
+    Pinch uses the Schmitt trigger from detect_gestures (enter below the
+    threshold, leave above threshold * 1.25), so the caller passes in the
+    current latch. A threshold <= 0 means that gesture is disabled."""
+    bits = _finger_bits(lm)
+
+    # Pinch compares squared distances - no sqrt needed for a threshold test.
+    dx = lm[4, 0] - lm[8, 0]
+    dy = lm[4, 1] - lm[8, 1]
+    pinch_sq = dx * dx + dy * dy
+    if pinch_threshold > 0.0:
+        if pinch_active:
+            release = pinch_threshold * 1.25
+            if pinch_sq <= release * release:
+                bits |= _POSE_PINCH
+        elif pinch_sq < pinch_threshold * pinch_threshold:
+            bits |= _POSE_PINCH
+
+    if fist_threshold > 0.0:
+        extended = 0
+        for i in range(5):
+            extended += (bits >> i) & 1
+        if extended <= 1:
+            # A mean of distances isn't a mean of squares, so these keep their
+            # sqrt - but they only run once the hand is already nearly closed.
+            total = 0.0
+            for tip in (4, 8, 12, 16, 20):
+                dx = lm[tip, 0] - lm[9, 0]
+                dy = lm[tip, 1] - lm[9, 1]
+                total += math.sqrt(dx * dx + dy * dy)
+            if total / 5.0 < fist_threshold:
+                bits |= _POSE_FIST
+    return bits
+
+
+@njit(cache=True)
+def _flick_step(lm, baseline, alpha):
+    """Limited-mode flick detector. The pose feature is each fingertip relative
+    to the wrist, normalized by hand size - relative to the wrist and scaled by
+    the palm, it isolates finger articulation from where the hand is, so moving
+    the hand to steer the cursor barely changes it, but flicking a finger
+    spikes it. Returns the summed deviation of the feature from `baseline`
+    (a (5, 2) array), then drifts `baseline` toward the feature in place by
+    `alpha`; alpha=1 simply adopts the current pose as the baseline."""
+    wx = lm[0, 0]
+    wy = lm[0, 1]
+    # middle-finger base (9) - stable hand-scale reference
+    dx = lm[9, 0] - wx
+    dy = lm[9, 1] - wy
+    scale = math.sqrt(dx * dx + dy * dy)
+    if scale == 0.0:
+        scale = 1e-6
+    deviation = 0.0
+    for i in range(5):
+        tip = 4 * i + 4
+        fx = (lm[tip, 0] - wx) / scale
+        fy = (lm[tip, 1] - wy) / scale
+        dx = fx - baseline[i, 0]
+        dy = fy - baseline[i, 1]
+        deviation += math.sqrt(dx * dx + dy * dy)
+        baseline[i, 0] = baseline[i, 0] * (1.0 - alpha) + fx * alpha
+        baseline[i, 1] = baseline[i, 1] * (1.0 - alpha) + fy * alpha
+    return deviation
+
+
+@njit(cache=True)
+def _cursor_filter_step(state, primed, raw_x, raw_y, base_alpha, dead_zone,
+                        min_x, max_x, min_y, max_y):
+    """One step of map_to_screen's cursor filter: velocity-adaptive double EMA,
+    radial dead-zone, clamp. `state` is a float64 array of 8 updated in place -
+    (pass-1 x, y, pass-2 x, y, previous raw x, y, last output x, y); primed=False
+    starts it fresh from this sample. Returns the screen (x, y)."""
+    # Velocity-adaptive smoothing: more smoothing when hand is slow (tremor),
+    # less smoothing when hand moves fast (intentional movement).
+    alpha = base_alpha
+    if primed:
+        dx = raw_x - state[4]
+        dy = raw_y - state[5]
+        v2 = dx * dx + dy * dy
+        # Map velocity to alpha: slow movement -> alpha up to 0.85, fast -> base_alpha.
+        # Threshold of ~80px/frame distinguishes tremor from intentional movement
+        # (beyond it the ratio saturates, so the sqrt is only needed below it)
+        speed_ratio = math.sqrt(v2) / 80.0 if v2 < 6400.0 else 1.0
+        alpha = base_alpha + (0.85 - base_alpha) * (1.0 - speed_ratio)
+    state[4] = raw_x
+    state[5] = raw_y
+
+    # First EMA pass, then a lighter second pass (double-EMA) for extra jitter
+    # removal without excessive lag.
+    alpha2 = base_alpha * 0.8
+    if primed:
+        state[0] = alpha * state[0] + (1.0 - alpha) * raw_x
+        state[1] = alpha * state[1] + (1.0 - alpha) * raw_y
+        state[2] = alpha2 * state[2] + (1.0 - alpha2) * state[0]
+        state[3] = alpha2 * state[3] + (1.0 - alpha2) * state[1]
+    else:
+        state[0] = state[2] = raw_x
+        state[1] = state[3] = raw_y
+
+    # Radial dead-zone with a soft ease-out. Inside `inner` the cursor holds
+    # still (kills resting tremor). Between inner and outer it eases out
+    # proportionally instead of snapping when the boundary is crossed, so a
+    # shaky hand can settle onto a small target instead of getting stuck just
+    # shy of it. Beyond outer the smoothed position passes straight through.
+    target_x = state[2]
+    target_y = state[3]
+    if primed:
+        dx = target_x - state[6]
+        dy = target_y - state[7]
+        dist_sq = dx * dx + dy * dy
+        inner = dead_zone
+        outer = 2.0 * dead_zone
+        # Compared squared: the distance itself is only needed in the ease band.
+        if dist_sq < inner * inner:
+            return state[6], state[7]
+        elif dist_sq < outer * outer:
+            frac = (math.sqrt(dist_sq) - inner) / (outer - inner)
+            target_x = state[6] + dx * frac
+            target_y = state[7] + dy * frac
+
+    state[6] = max(min_x, min(max_x, target_x))
+    state[7] = max(min_y, min(max_y, target_y))
+    return state[6], state[7]
+
+
+# count_extended_fingers result for every _finger_bits mask: (count, states)
+_FINGER_STATES = [(bin(b).count("1"), tuple(bool(b >> i & 1) for i in range(5)))
+                  for b in range(32)]
+
+
+class _FrameGrabber:
+    """Reads the camera on a daemon thread and keeps only the newest frame.
+    cap.read() blocks until the driver delivers a frame; doing that inside the
+    tracking tick serialized capture with inference and stalled the GUI thread.
+    Here the read and BGR->RGB conversion of the next frame overlap with
+    MediaPipe on the current one, and a consumer that falls behind just skips
+    to the latest frame (drop-oldest) instead of lagging.
+
+    Frames are published as captured, never flipped: the tracking loop and the
+    setup wizard mirror the landmarks instead, and the previews mirror their
+    downscaled display copy. The `infer` callable (MediaPipe) is run on the
+    RGB frame here too and its result published alongside, so even the hand
+    model stays off the GUI thread.
+
+    Only one reader may touch the capture device: stop() before anything else
+    (another grabber, release()) reads from or closes it."""
+
+    # Longest side of the RGB frame handed to MediaPipe. Its palm/landmark
+    # models run at ~224 px internally and return normalized coordinates, so
+    # feeding the full 1280x720 capture only costs resize + conversion time.
+    INFER_MAX_SIDE = 640
+
+    def __init__(self, cap, infer):
+        self.cap = cap
+        self.infer = infer
+        self.fail_count = 0    # consecutive failed reads (camera taken/unplugged?)
+        self.infer_fail_count = 0  # consecutive frames whose infer() raised
+        self._lock = threading.Lock()
+        self._latest = None    # (seq, t_capture, frame_bgr, result)
+        self._seq = 0
+        self._rgb_buf = None   # reused inference input
+        # --opencl: run the resize/convert through OpenCV's T-API (cv2.UMat),
+        # which dispatches to the GPU via OpenCL when one is there. Off by
+        # default: the RGB result still has to come back to host memory
+        # (MediaPipe needs an ndarray), and on a discrete GPU the upload +
+        # download can cost more than the CPU work it replaces.
+        self.use_opencl = False
+        # Set while stopped. An Event rather than a flag so the failed-read
+        # backoff waits on it and stop() doesn't sit out the sleep (the wizard
+        # hands the camera back and forth with stop()/start()).
+        self._stopped = threading.Event()
+        self._stopped.set()
+        self._thread = None
+
+    def start(self):
+        if not self._stopped.is_set():
+            return
+        if self._thread is not None:
+            # An earlier stop() timed out while the reader was stuck in a
+            # blocking read; it has to let go before a new one starts.
+            self._thread.join()
+            self._thread = None
+        self._stopped.clear()
+        self.infer_fail_count = 0
+        self._thread = threading.Thread(target=self._run, name="AirPointCapture", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """Stop reading and wait for the thread to let go of the device.
+        cap.read() can block for seconds on a stalled or unplugged camera
+        (V4L2 waits 10 s), so a caller that can't wait that long passes a
+        timeout: False means the reader is still inside read()/infer(). The
+        thread is kept then, and the device must not be handed to another
+        reader or released until a later stop() returns True."""
+        self._stopped.set()
+        t = self._thread
+        if t is not None:
+            t.join(timeout)
+            if t.is_alive():
+                return False
+            self._thread = None
+        return True
+
+    def latest(self):
+        """Newest (seq, t_capture, frame_bgr, result), or None before the
+        first frame. frame_bgr is the full-resolution frame as captured
+        (unmirrored); result is what infer() returned for it."""
+        with self._lock:
+            return self._latest
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                # A fresh array per read: the raw frame itself is handed out
+                # (the consumer keeps it and the preview draws on it), so it
+                # can't be decoded into a recycled buffer.
+                ret, frame = self.cap.read()
+                t_cap = time.perf_counter()
+                if not ret:
+                    self.fail_count += 1
+                    self._stopped.wait(0.033)
+                    continue
+                self.fail_count = 0
+                h, w = frame.shape[:2]
+                scale = self.INFER_MAX_SIDE / max(h, w)
+                if self.use_opencl:
+                    frame_u = cv2.UMat(frame)
+                    small_u = frame_u if scale >= 1.0 else cv2.resize(
+                        frame_u, (round(w * scale), round(h * scale)),
+                        interpolation=cv2.INTER_AREA)
+                    rgb = cv2.cvtColor(small_u, cv2.COLOR_BGR2RGB).get()
+                else:
+                    size = (round(w * scale), round(h * scale)) if scale < 1.0 else (w, h)
+                    # The RGB frame is only read by infer() on this thread,
+                    # which is done with it before the next read, so the same
+                    # buffer serves every frame.
+                    rgb = self._rgb_buf
+                    if rgb is None or rgb.shape[1::-1] != size:
+                        rgb = self._rgb_buf = np.empty((size[1], size[0], 3), np.uint8)
+                    rgb.flags.writeable = True
+                    if scale < 1.0:
+                        # Resize into the RGB buffer, then convert it in place
+                        # rather than going through yet another frame.
+                        cv2.resize(frame, size, dst=rgb, interpolation=cv2.INTER_AREA)
+                        cv2.cvtColor(rgb, cv2.COLOR_BGR2RGB, dst=rgb)
+                    else:
+                        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb)
+                # Read-only lets MediaPipe wrap the array without copying it;
+                # nothing downstream draws on the RGB frame (the preview uses
+                # the BGR one).
+                rgb.flags.writeable = False
+            except Exception as e:
+                print(f"Camera read failed: {e}")
+                self.fail_count += 1
+                self._stopped.wait(0.033)
+                continue
+            try:
+                result = self.infer(rgb)
+            except Exception as e:
+                # Nothing is published for a failed frame, so the consumer
+                # watches infer_fail_count to give up on a broken model.
+                # Only the first failure of a run goes to crash.log - the
+                # same traceback ~30 times a second would bury it.
+                self.infer_fail_count += 1
+                if self.infer_fail_count == 1:
+                    _write_crash_log(type(e), e, e.__traceback__)
+                continue
+            self.infer_fail_count = 0
+            self._seq += 1
+            with self._lock:
+                self._latest = (self._seq, t_cap, frame, result)
+
+
+class _CursorMover:
+    """Moves the OS cursor from a dedicated daemon thread so cursor syscalls
+    (see _native_backend; pyautogui.moveTo where there's none) never block the
+    tracking tick. Only the latest target matters, so a move posted while an
+    earlier one is still pending simply replaces it.
+
+    The thread also tracks where the cursor is - the last position it moved
+    to, refreshed from the OS while idle so a physical mouse is still picked
+    up - so position() never has to round-trip to the OS from the tick.
+
+    Clicks/scrolls stay on the caller's thread; call flush() first so they
+    land where the cursor was last sent, not where it was a frame ago."""
+
+    IDLE_POLL_S = 0.05   # how often the real cursor position is re-read while idle
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._target = None   # pending (x, y), or None
+        self._busy = False    # worker is inside moveTo
+        try:
+            self._known = tuple(pyautogui.position())
+        except Exception:
+            self._known = (0, 0)
+        self._set_cursor_pos = self._native_backend()
+        threading.Thread(target=self._run, name="AirPointCursor", daemon=True).start()
+
+    @staticmethod
+    def _native_backend():
+        """A move(x, y) that calls the OS directly, or None to use pyautogui.
+        pyautogui.moveTo reaches the same OS call, but only after argument
+        normalization, a screen-size query and its failsafe checks, and on X11
+        it waits for a server round-trip - on every move. Anything that fails
+        to load here just leaves pyautogui in charge."""
+        try:
+            import ctypes
+            import ctypes.util
+            if sys.platform == "win32":
+                return ctypes.windll.user32.SetCursorPos
+            if sys.platform == "darwin":
+                # A mouse-moved event posted at the HID level, as pyautogui
+                # does through Quartz (CGWarpMouseCursorPosition would briefly
+                # suppress the user's own mouse afterwards).
+                cg = ctypes.cdll.LoadLibrary(ctypes.util.find_library("ApplicationServices"))
+
+                class CGPoint(ctypes.Structure):
+                    _fields_ = [("x", ctypes.c_double), ("y", ctypes.c_double)]
+
+                cg.CGEventCreateMouseEvent.restype = ctypes.c_void_p
+                cg.CGEventCreateMouseEvent.argtypes = [ctypes.c_void_p, ctypes.c_uint32,
+                                                       CGPoint, ctypes.c_uint32]
+                cg.CGEventPost.argtypes = [ctypes.c_uint32, ctypes.c_void_p]
+                cg.CFRelease.argtypes = [ctypes.c_void_p]
+                K_MOUSE_MOVED, K_HID_EVENT_TAP = 5, 0
+
+                def move(x, y):
+                    ev = cg.CGEventCreateMouseEvent(None, K_MOUSE_MOVED, CGPoint(x, y), 0)
+                    cg.CGEventPost(K_HID_EVENT_TAP, ev)
+                    cg.CFRelease(ev)
+                return move
+            if os.environ.get("DISPLAY"):
+                # X11 via XTest on a connection of our own - only this thread
+                # uses it. XFlush sends the request without waiting on a reply.
+                x11 = ctypes.cdll.LoadLibrary(ctypes.util.find_library("X11"))
+                xtst = ctypes.cdll.LoadLibrary(ctypes.util.find_library("Xtst"))
+                x11.XOpenDisplay.restype = ctypes.c_void_p
+                x11.XOpenDisplay.argtypes = [ctypes.c_char_p]
+                x11.XFlush.argtypes = [ctypes.c_void_p]
+                xtst.XTestFakeMotionEvent.argtypes = [ctypes.c_void_p, ctypes.c_int,
+                                                      ctypes.c_int, ctypes.c_int, ctypes.c_ulong]
+                dpy = x11.XOpenDisplay(None)
+                if not dpy:
+                    return None
+
+                def move(x, y):
+                    xtst.XTestFakeMotionEvent(dpy, -1, x, y, 0)
+                    x11.XFlush(dpy)
+                return move
+        except Exception:
+            pass
+        return None
+
+    def move(self, x, y):
+        # Moves land on whole pixels, so one that rounds to where the cursor
+        # already is (or is about to be) would be a wasted OS call - common
+        # while the dead-zone holds the output still. Never raises: the OS
+        # call (and its failure) happens on the mover thread, so callers
+        # don't wrap it.
+        x, y = int(round(x)), int(round(y))
+        with self._cond:
+            if (x, y) == (self._target if self._target is not None else self._known):
+                return
+            self._target = (x, y)
+            self._cond.notify_all()
+
+    def position(self):
+        """Integer (x, y) of where the cursor is, or is about to be: the
+        pending target if a move hasn't been applied yet, else the tracked
+        position. No OS call."""
+        with self._cond:
+            x, y = self._target if self._target is not None else self._known
+        return int(x), int(y)
+
+    def flush(self, timeout=0.05):
+        """Block (briefly) until every posted move has been applied."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._target is None and not self._busy, timeout)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if not self._cond.wait_for(lambda: self._target is not None, self.IDLE_POLL_S):
+                    target = None
+                else:
+                    target = self._target
+                    self._target = None
+                    self._busy = True
+            if target is None:
+                # Idle: pick up any movement of a real mouse.
+                try:
+                    pos = tuple(pyautogui.position())
+                except Exception:
+                    continue
+                with self._cond:
+                    if self._target is None and not self._busy:
+                        self._known = pos
+                continue
+            try:
+                if self._set_cursor_pos is not None:
+                    self._set_cursor_pos(target[0], target[1])
+                else:
+                    pyautogui.moveTo(target[0], target[1], duration=0)
+            except Exception as e:
+                print(f"Cursor move failed: {e}")
+            finally:
+                with self._cond:
+                    self._known = target
+                    self._busy = False
+                    self._cond.notify_all()
+
+
 class _BenchLog:
     """Opt-in per-frame benchmark logger (enabled by --benchmark, inert otherwise).
     Records per-stage latency, FPS basis, hand-detection, raw-vs-smoothed cursor
@@ -3699,7 +4405,7 @@ class HandCenterGestureController:
             except Exception:
                 print(f"{title}\n{message}")
 
-    def __init__(self, enable_gaze_detection=True):
+    def __init__(self, enable_gaze_detection=True, camera_size=(1280, 720), camera_fps=None):
         # Apply all defaults from DEFAULT_CONFIG first (sets every configurable attribute)
         self._apply_config(DEFAULT_CONFIG)
 
@@ -3727,36 +4433,48 @@ class HandCenterGestureController:
         # Non-configurable state
         self.face_detected = False
         self.looking_at_screen = False
-        self.face_detection_history = deque(maxlen=5)
+        # Last 5 gaze samples as two bit rings (newest in bit 0): face seen /
+        # looking forward. Counting them is a popcount, not a loop over tuples.
+        self._face_bits = 0
+        self._gaze_bits = 0
+        self._face_samples = 0       # samples so far, saturating at 5
         self.gaze_cooldown = 0
+        # FaceMesh runs on every gaze_every-th frame only; in between the last
+        # decision stands. Where someone looks changes over hundreds of ms, and
+        # the 5-sample history then spans ~0.5 s at 30 fps instead of ~0.17 s.
+        self.gaze_every = 3
+        self._gaze_frame_idx = 0
 
         # Initialize MediaPipe. Detect up to 2 hands so that when a helper/aide's
         # hand also enters the frame we can deliberately pick ONE to control the
         # cursor (see _select_hand) instead of MediaPipe arbitrarily flipping
         # between them - which made the cursor jump around.
+        # model_complexity=0 is the lite landmark model: about half the cost
+        # per frame. The cursor follows the palm center, a mean of five
+        # landmarks, which averages out most of its extra per-landmark noise.
         self.mp_hands = mp.solutions.hands
         self.hands = self.mp_hands.Hands(
             static_image_mode=False,
             max_num_hands=2,
+            model_complexity=0,
             min_detection_confidence=0.7,
-            min_tracking_confidence=0.7
+            # MediaPipe's default. Below this the palm detector reruns on the
+            # next frame - the expensive stage - so the stricter 0.7 traded
+            # periodic detection spikes for nothing: a hand first has to pass
+            # the 0.7 detection bar to be tracked at all.
+            min_tracking_confidence=0.5
         )
         self.mp_draw = mp.solutions.drawing_utils
+        # Preview styles, built once rather than on every drawn frame.
+        self._landmark_spec = self.mp_draw.DrawingSpec(color=(255, 143, 171), thickness=2, circle_radius=3)
+        self._connection_spec = self.mp_draw.DrawingSpec(color=(120, 170, 255), thickness=2)
         self._tracked_hand_center = None  # locked hand's last center (continuity)
 
-        # Face detection for gaze awareness (only if enabled)
-        if self.gaze_detection_enabled:
-            self.mp_face_mesh = mp.solutions.face_mesh
-            self.face_mesh = self.mp_face_mesh.FaceMesh(
-                static_image_mode=False,
-                max_num_faces=1,
-                refine_landmarks=True,
-                min_detection_confidence=0.5,
-                min_tracking_confidence=0.5
-            )
-        else:
-            self.mp_face_mesh = None
-            self.face_mesh = None
+        # Face detection for gaze awareness. Built on first use by
+        # detect_face_and_gaze (gaze starts off every session), so start-up
+        # doesn't pay for loading a model most sessions never run.
+        self.mp_face_mesh = None
+        self.face_mesh = None
 
         # Initialize camera
         self.cap = cv2.VideoCapture(0)
@@ -3778,8 +4496,26 @@ class HandCenterGestureController:
                 settings_label="Open Camera Settings",
             )
             raise SystemExit(1)
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+        # Ask for MJPG before the resolution (the format decides which sizes are
+        # offered): uncompressed YUYV at 1280x720 saturates USB 2.0 and many
+        # webcams then drop to 5-10 fps. Drivers without MJPG just ignore it.
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+        # 1280x720 by default even though MediaPipe only ever sees a 640 px copy
+        # (see _FrameGrabber.INFER_MAX_SIDE): calibration boxes are stored in
+        # normalized coordinates, and many webcams crop or change aspect at
+        # lower modes (640x480 is 4:3), which would silently shift every saved
+        # profile. --camera opts into a smaller mode to save USB bandwidth and
+        # decode time on slow machines.
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, camera_size[0])
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, camera_size[1])
+        if camera_fps:
+            # Only on request: more frames means more hand inference per second.
+            self.cap.set(cv2.CAP_PROP_FPS, camera_fps)
+        # Keep at most one frame queued in the driver so a read never returns a
+        # stale one. Not every backend honors this (set() then returns False);
+        # the capture thread reading continuously covers those.
+        if not self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+            print("  Warning: camera backend ignored BUFFERSIZE=1, relying on the capture thread")
 
         # Verify we can actually read a frame. The FIRST read can transiently
         # return False even when the camera/permission are fine - especially on
@@ -3853,6 +4589,7 @@ class HandCenterGestureController:
 
         # Screen dimensions (DPI-aware on Windows)
         self.screen_width, self.screen_height = pyautogui.size()
+        self._cursor = _CursorMover()  # async, latest-wins cursor moves
 
         # Gesture state (not configurable - runtime state)
         self.pinch_start_time = None
@@ -3862,12 +4599,60 @@ class HandCenterGestureController:
         self.drag_start_screen_pos = None
         self.prev_hand_center = None
         self.last_action_time = 0
-        self.fist_history = deque(maxlen=8)
+        # Per-frame fist states as a rolling bitmask: bit 0 = this frame,
+        # bit 1 = the frame before, ... (see the FIST DETECTION edge test).
+        self.fist_bits = 0
+        self._fist_frames = 0   # frames seen, saturating at 5 (window filled)
+        # Landmark ring buffer reused by get_landmarks (see there)
+        self._lm_ring = np.zeros((8, 21, 2), dtype=np.float64)
+        self._lm_ring_idx = 0
         self.overlay = None  # ClickFeedbackOverlay, created in run() once a QApplication exists
         self.paused = False  # when True the tracking tick does no detection/cursor control
         self._bench = None          # _BenchLog while --benchmark is active
         self._bench_seconds = 0     # >0 enables benchmark logging in run()
         self._bench_out = None      # optional CSV path for --benchmark
+        self.debug = False          # --debug: print per-gesture event lines (pinch, drag, scroll...)
+        # --debug lines are queued here by the tick and written out in one go
+        # every half second (see _flush_debug_log): a console write per event -
+        # a dragging line every frame - is a syscall each, a slow one on Windows.
+        self._debug_lines = deque(maxlen=256)
+
+        # Camera reads run on their own thread (started/stopped with tracking in
+        # run()); the tick only consumes the newest frame, so a slow frame can
+        # never leave the pipeline working through a backlog of stale ones.
+        # MediaPipe (hands + gaze) runs on that thread too, via _infer_frame:
+        # its graphs execute in native code without the GIL, so inference of
+        # the next frame overlaps the gesture logic and UI of the current one,
+        # and a slow inference no longer holds up Qt's event loop.
+        # The frame is never flipped. The landmarks are mirrored instead
+        # (get_landmarks(mirror=True), 21 x-values rather than a pass over the
+        # full camera image) and the preview flips its small display copy -
+        # the same arrangement the setup wizard uses.
+        self._grabber = _FrameGrabber(self.cap, infer=self._infer_frame)
+        self._frame_seq = 0   # seq of the last frame the tick processed
+
+        # --infer-every N: run MediaPipe on every Nth frame only and reuse the
+        # previous result in between (1 = every frame, the default).
+        self.infer_every = 1
+        self._frame_idx = 0
+        self._last_hand_results = None
+
+        # --skip-still: also reuse the previous result while the camera image
+        # is essentially unchanged (a resting hand), judged by the mean
+        # difference between consecutive 160x90 grayscale thumbnails. The
+        # threshold is in 0-255 gray levels. The reuse streak is capped, so a
+        # small finger movement (pinch start) that barely changes the image is
+        # still seen within a few frames.
+        self.skip_still = False
+        self.still_diff = 1.5
+        self.still_max_reuse = 3
+        self._prev_gray = None
+        self._still_reuse = 0
+
+        # --overlay: what the "see yourself" preview draws on the camera image.
+        # "full" = every hand's skeleton, "minimal" = just the controlling
+        # hand's center, "off" = the bare camera image (no drawing calls).
+        self.overlay_mode = "full"
 
         # Two-finger scroll state
         self.scroll_reference_y = None
@@ -3879,10 +4664,13 @@ class HandCenterGestureController:
         self.profile_name = None
 
         # EMA cursor smoothing state (double-EMA: two cascaded passes)
-        self.smoothed_screen_pos = None
-        self._smoothed_pass2 = None  # second EMA pass for extra jitter removal
-        self._last_output_pos = None  # for dead-zone filtering
-        self._prev_raw_pos = None  # for velocity-adaptive smoothing
+        # Cursor filter state for _cursor_filter_step: both EMA passes, the
+        # previous raw position (velocity) and the last output (dead-zone).
+        self._cursor_state = np.zeros(8)
+        self._cursor_primed = False
+        self._cal_map = None         # see _update_cal_map
+        self._cal_map_src = None
+        self._cal_map_margin = None
 
         # Dwell-click state
         self.dwell_reference_pos = None
@@ -3903,16 +4691,8 @@ class HandCenterGestureController:
         self.gaze_detection_enabled = not self.gaze_detection_enabled
 
         if self.gaze_detection_enabled:
-            # Initialize face detection if it wasn't already
-            if self.mp_face_mesh is None:
-                self.mp_face_mesh = mp.solutions.face_mesh
-                self.face_mesh = self.mp_face_mesh.FaceMesh(
-                    static_image_mode=False,
-                    max_num_faces=1,
-                    refine_landmarks=True,
-                    min_detection_confidence=0.5,
-                    min_tracking_confidence=0.5
-                )
+            # The face mesh itself is built on the next frame, on the capture
+            # thread (see detect_face_and_gaze), not here on the GUI thread.
             print("👁️ GAZE DETECTION ENABLED - Only works when looking at screen")
         else:
             print("👁️ GAZE DETECTION DISABLED - Always active")
@@ -4045,16 +4825,28 @@ class HandCenterGestureController:
             new["thresholds"]["fist_threshold"] = old["fist_threshold"]
         return new
 
-    @staticmethod
-    def list_profiles():
-        """Return sorted list of profile names found in the profiles directory."""
-        if not os.path.isdir(PROFILES_DIR):
+    # (profiles dir, its mtime, names) from the last list_profiles scan
+    _profiles_cache = (None, None, [])
+
+    @classmethod
+    def list_profiles(cls):
+        """Return sorted list of profile names found in the profiles directory.
+        Creating, deleting or renaming a file bumps the directory's mtime, so
+        the last scan is reused until that changes (the wizard and settings
+        pages ask for the list on every rebuild)."""
+        try:
+            mtime = os.stat(PROFILES_DIR).st_mtime_ns
+        except OSError:
             return []
+        cached_dir, cached_mtime, cached = cls._profiles_cache
+        if cached_dir == PROFILES_DIR and cached_mtime == mtime:
+            return list(cached)
         names = []
         for f in sorted(os.listdir(PROFILES_DIR)):
             if f.endswith(".json"):
                 names.append(f[:-5])  # strip .json
-        return names
+        cls._profiles_cache = (PROFILES_DIR, mtime, names)
+        return list(names)
 
     def load_profile(self, name):
         """Load a profile by name. Auto-migrates old flat format to new schema."""
@@ -4062,8 +4854,7 @@ class HandCenterGestureController:
         if not os.path.exists(path):
             return False
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                raw = json.load(f)
+            raw = _read_json(path)
         except (json.JSONDecodeError, ValueError) as e:
             print(f"Error: Corrupted profile '{name}': {e}")
             return False
@@ -4085,10 +4876,7 @@ class HandCenterGestureController:
             set_language(raw["language"])
 
         # Reset smoothing state for new profile
-        self.smoothed_screen_pos = None
-        self._smoothed_pass2 = None
-        self._prev_raw_pos = None
-        self._last_output_pos = None
+        self._reset_smoothing()
         self.dwell_reference_pos = None
         self.dwell_start_time = None
         self.dwell_triggered = False
@@ -4167,8 +4955,7 @@ class HandCenterGestureController:
         # so a crash or AV lock mid-write can't truncate/corrupt the profile
         # (os.replace is atomic and overwrites the destination on Windows too).
         tmp = f"{path}.tmp"
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2)
+        _write_json(tmp, config)
         os.replace(tmp, path)
         print(f"Profile '{self.profile_name}' saved to {path}")
 
@@ -4187,10 +4974,7 @@ class HandCenterGestureController:
         self.scroll_amount = preset["scroll_amount"]
         self.dwell_click_duration = preset["dwell_duration"]
         # Reset smoothing / dead-zone state so the new alpha & radius start clean.
-        self.smoothed_screen_pos = None
-        self._smoothed_pass2 = None
-        self._prev_raw_pos = None
-        self._last_output_pos = None
+        self._reset_smoothing()
         if self.profile_name is not None:
             self.save_profile()
         print(f"Preset applied: {name}")
@@ -4331,7 +5115,7 @@ class HandCenterGestureController:
         if self.overlay is None or not getattr(self, "click_feedback_enabled", True):
             return
         try:
-            x, y = pyautogui.position()
+            x, y = self._cursor.position()
             self.overlay.flash(x, y, kind)
         except Exception:
             pass
@@ -4339,6 +5123,7 @@ class HandCenterGestureController:
     def _do_action(self, action):
         """Perform a discrete click action (for the remappable pinch / fist
         gestures) and flash matching feedback. 'none'/unknown is a no-op."""
+        self._cursor.flush()
         try:
             if action == "left_click":
                 pyautogui.click(); kind = "left"
@@ -4355,6 +5140,36 @@ class HandCenterGestureController:
             return
         self._emit_click(kind)
 
+    def _warm_up(self):
+        """Run one throwaway inference (and compile the gesture kernels) before
+        tracking starts. The first MediaPipe call sets up XNNPACK kernels and
+        tensors, and the first numba call JIT-compiles - hundreds of ms that
+        would otherwise land on the first tracked frames as a visible stutter.
+        FaceMesh isn't warmed: it's only created when gaze detection is first
+        switched on (see _create_face_mesh), never before tracking starts."""
+        t0 = time.perf_counter()
+        try:
+            dummy = np.zeros((360, 640, 3), dtype=np.uint8)
+            self.hands.process(dummy)
+            _classify_pose(np.zeros((21, 2)), False, 0.05, 0.06)
+            _flick_step(np.zeros((21, 2)), np.zeros((5, 2)), 0.15)
+            _cursor_filter_step(np.zeros(8), True, 0.0, 0.0, 0.65, 10.0, 0.0, 1.0, 0.0, 1.0)
+        except Exception as e:
+            print(f"Warm-up skipped: {e}")
+            return
+        print(f"Tracking warm-up took {(time.perf_counter() - t0) * 1000:.0f} ms")
+
+    def _flush_camera(self, frames=5):
+        """Discard frames the camera driver buffered while nobody was reading
+        (grab() only, no decode). Cheaper than release()+reopen, which takes
+        a second or more on Windows and can lose the device to another app."""
+        for _ in range(frames):
+            try:
+                if not self.cap.grab():
+                    break
+            except Exception:
+                break
+
     def _fatal_exit(self, title, message, settings_url=None, settings_label="Open Settings"):
         """Stop tracking, then show a final error dialog and quit - without
         re-entrant stacking. Called from inside the tracking tick on
@@ -4367,6 +5182,9 @@ class HandCenterGestureController:
         t = getattr(self, "_tracking_timer", None)
         if t is not None:
             t.stop()
+        # Don't hold the dialog up behind a stalled read; run()'s cleanup
+        # waits for the reader before releasing the camera.
+        self._grabber.stop(timeout=1.0)
         try:
             self._show_startup_error(title, message,
                                      settings_url=settings_url,
@@ -4384,91 +5202,70 @@ class HandCenterGestureController:
             raw_x = hand_x * self.screen_width
             raw_y = hand_y * self.screen_height
         else:
-            cal = self.calibration
-            # Add a small margin so edges are reachable
-            range_x = cal["right"] - cal["left"]
-            range_y = cal["bottom"] - cal["top"]
-
-            # Guard against zero range (bad calibration data)
-            if range_x == 0 or range_y == 0:
+            # The calibration box only changes when a profile loads or the
+            # wizard finishes (both assign a new dict), so its offset/scale are
+            # derived once per dict and margin rather than every frame.
+            if (self.calibration is not self._cal_map_src
+                    or self.calibration_margin != self._cal_map_margin):
+                self._update_cal_map()
+            if self._cal_map is None:
+                # Zero range (bad calibration data): use full normalized range
                 raw_x = hand_x * self.screen_width
                 raw_y = hand_y * self.screen_height
             else:
-                margin_x = range_x * self.calibration_margin
-                margin_y = range_y * self.calibration_margin
-
-                norm_x = (hand_x - (cal["left"] - margin_x)) / (range_x + 2 * margin_x)
-                norm_y = (hand_y - (cal["top"] - margin_y)) / (range_y + 2 * margin_y)
-
-                # Clamp to [0, 1]
-                norm_x = max(0.0, min(1.0, norm_x))
-                norm_y = max(0.0, min(1.0, norm_y))
-
-                raw_x = norm_x * self.screen_width
-                raw_y = norm_y * self.screen_height
-
-        # Velocity-adaptive smoothing: more smoothing when hand is slow (tremor),
-        # less smoothing when hand moves fast (intentional movement).
-        base_alpha = self.smoothing_factor  # e.g. 0.65
-        if self._prev_raw_pos is not None:
-            velocity = math.sqrt((raw_x - self._prev_raw_pos[0]) ** 2 +
-                                 (raw_y - self._prev_raw_pos[1]) ** 2)
-            # Map velocity to alpha: slow movement → alpha up to 0.85, fast → base_alpha or lower
-            # Threshold of ~80px/frame distinguishes tremor from intentional movement
-            speed_ratio = min(velocity / 80.0, 1.0)
-            alpha = base_alpha + (0.85 - base_alpha) * (1.0 - speed_ratio)
-        else:
-            alpha = base_alpha
-        self._prev_raw_pos = [raw_x, raw_y]
-
-        # First EMA pass
-        if self.smoothed_screen_pos is None:
-            self.smoothed_screen_pos = [raw_x, raw_y]
-        else:
-            self.smoothed_screen_pos[0] = alpha * self.smoothed_screen_pos[0] + (1 - alpha) * raw_x
-            self.smoothed_screen_pos[1] = alpha * self.smoothed_screen_pos[1] + (1 - alpha) * raw_y
-
-        # Second EMA pass (double-EMA) for extra jitter removal
-        alpha2 = base_alpha * 0.8  # lighter second pass to avoid excessive lag
-        if self._smoothed_pass2 is None:
-            self._smoothed_pass2 = list(self.smoothed_screen_pos)
-        else:
-            self._smoothed_pass2[0] = alpha2 * self._smoothed_pass2[0] + (1 - alpha2) * self.smoothed_screen_pos[0]
-            self._smoothed_pass2[1] = alpha2 * self._smoothed_pass2[1] + (1 - alpha2) * self.smoothed_screen_pos[1]
-
-        # Radial dead-zone with a soft ease-out. Inside `inner` the cursor holds
-        # still (kills resting tremor). Between inner and outer it eases out
-        # proportionally instead of snapping when the boundary is crossed, so a
-        # shaky hand can settle onto a small target instead of getting stuck just
-        # shy of it. Beyond outer the smoothed position passes straight through.
-        # (Replaces the old anisotropic dx<dz AND dy<dz square latch.)
-        target_x, target_y = self._smoothed_pass2[0], self._smoothed_pass2[1]
-        if self._last_output_pos is not None:
-            dx = target_x - self._last_output_pos[0]
-            dy = target_y - self._last_output_pos[1]
-            dist = math.hypot(dx, dy)
-            inner = self.cursor_dead_zone
-            outer = 2.0 * self.cursor_dead_zone
-            if dist < inner:
-                return self._last_output_pos[0], self._last_output_pos[1]
-            elif dist < outer:
-                frac = (dist - inner) / (outer - inner)
-                target_x = self._last_output_pos[0] + dx * frac
-                target_y = self._last_output_pos[1] + dy * frac
-
-        # Clamp to screen bounds with margin
-        m = self.screen_edge_margin
-        screen_x = max(m, min(self.screen_width - m, target_x))
-        screen_y = max(m, min(self.screen_height - m, target_y))
-        self._last_output_pos = [screen_x, screen_y]
-        return screen_x, screen_y
-
-    def get_landmarks(self, hand_landmarks):
-        """Extract hand landmark coordinates"""
-        landmarks = []
-        for lm in hand_landmarks.landmark:
-            landmarks.append([lm.x, lm.y])
-        return np.array(landmarks)
+                x0, sx, y0, sy = self._cal_map
+                # Clamp to the screen ([0, 1] before scaling)
+                raw_x = max(0.0, min(self.screen_width, (hand_x - x0) * sx))
+                raw_y = max(0.0, min(self.screen_height, (hand_y - y0) * sy))
+
+        # Smoothing, dead-zone and clamp run in one compiled kernel on a small
+        # state array (see _cursor_filter_step). Every scalar goes in as a
+        # float: numba compiles one specialization per argument-type mix, and
+        # the int screen sizes / profile values would otherwise get a second
+        # one on the first tracked frame instead of the one _warm_up built.
+        m = float(self.screen_edge_margin)
+        sw, sh = float(self.screen_width), float(self.screen_height)
+        out = _cursor_filter_step(self._cursor_state, self._cursor_primed,
+                                  float(raw_x), float(raw_y), float(self.smoothing_factor),
+                                  float(self.cursor_dead_zone), m, sw - m, m, sh - m)
+        self._cursor_primed = True
+        return out
+
+    def _update_cal_map(self):
+        """Derive map_to_screen's (x0, x_scale, y0, y_scale) from the current
+        calibration: the box widened by calibration_margin on each side (so
+        the edges are reachable) and stretched over the screen. None when
+        the box has zero width or height."""
+        cal = self.calibration
+        self._cal_map_src = cal
+        self._cal_map_margin = self.calibration_margin
+        range_x = cal["right"] - cal["left"]
+        range_y = cal["bottom"] - cal["top"]
+        if range_x == 0 or range_y == 0:
+            self._cal_map = None
+            return
+        margin_x = range_x * self.calibration_margin
+        margin_y = range_y * self.calibration_margin
+        self._cal_map = (cal["left"] - margin_x, self.screen_width / (range_x + 2 * margin_x),
+                         cal["top"] - margin_y, self.screen_height / (range_y + 2 * margin_y))
+
+    def get_landmarks(self, hand_landmarks, mirror=False):
+        """Extract hand landmark coordinates as a (21, 2) array.
+        mirror=True flips x (x -> 1 - x), giving selfie-view coordinates from
+        a result computed on an unmirrored frame.
+        Written in place into the next slot of a small preallocated ring, so no
+        per-frame array is allocated. The ring is deeper than the number of
+        hands per frame, so every candidate from _select_hand (and anything
+        holding last frame's array) stays valid until the next tick or two."""
+        slot = self._lm_ring[self._lm_ring_idx]
+        self._lm_ring_idx = (self._lm_ring_idx + 1) % len(self._lm_ring)
+        # Filled a column at a time from flat float lists: NumPy converts those
+        # far faster than a list of (x, y) tuples, which it has to walk as a
+        # nested sequence - and it beats 42 scalar item assignments too.
+        points = hand_landmarks.landmark
+        slot[:, 0] = [1.0 - lm.x for lm in points] if mirror else [lm.x for lm in points]
+        slot[:, 1] = [lm.y for lm in points]
+        return slot
 
     def _select_hand(self, multi_hand_landmarks):
         """Pick the ONE hand that controls the cursor and return its landmarks.
@@ -4479,7 +5276,13 @@ class HandCenterGestureController:
         second hand entering elsewhere is ignored. On a fresh lock (no prior
         hand) we pick the most-centered hand, since the student sits in front of
         the camera while a helper reaches in from the side."""
-        cands = [self.get_landmarks(hl) for hl in multi_hand_landmarks]
+        if len(multi_hand_landmarks) == 1:
+            # The usual case: nothing to choose between.
+            lm = self.get_landmarks(multi_hand_landmarks[0], mirror=True)
+            self._tracked_hand_center = self.calculate_hand_center(lm)
+            self._selected_hand_idx = 0
+            return lm
+        cands = [self.get_landmarks(hl, mirror=True) for hl in multi_hand_landmarks]
         centers = [self.calculate_hand_center(lm) for lm in cands]
         prev = self._tracked_hand_center
         if prev is not None:
@@ -4492,71 +5295,40 @@ class HandCenterGestureController:
         self._selected_hand_idx = idx   # for the camera preview's handedness label
         return cands[idx]
 
-    def calculate_hand_center(self, landmarks):
-        """Calculate the center of the hand using key landmarks"""
-        # Use palm landmarks and wrist for a stable center point
-        key_points = [
-            landmarks[0],   # Wrist
-            landmarks[5],   # Index MCP
-            landmarks[9],   # Middle MCP
-            landmarks[13],  # Ring MCP
-            landmarks[17],  # Pinky MCP
-        ]
-
-        center_x = np.mean([point[0] for point in key_points])
-        center_y = np.mean([point[1] for point in key_points])
+    # Wrist + the four finger MCPs: the palm anchors, which barely move when
+    # the fingers do, so their mean is a stable hand center.
+    _PALM_IDX = np.array([0, 5, 9, 13, 17])
+    _TIP_IDX = np.array([4, 8, 12, 16, 20])
 
-        return [center_x, center_y]
+    def calculate_hand_center(self, landmarks):
+        """Calculate the center of the hand using key landmarks.
+        Returns a length-2 array (x, y) - one indexed reduction over the palm
+        anchors instead of building point lists."""
+        return landmarks[self._PALM_IDX].mean(axis=0)
 
     def calculate_distance(self, point1, point2):
         """Calculate distance between two points"""
         return math.sqrt((point1[0] - point2[0])**2 + (point1[1] - point2[1])**2)
 
-    def count_extended_fingers(self, landmarks):
-        """Count extended fingers with LOOSER thresholds for better two-finger detection"""
-        finger_tips = [4, 8, 12, 16, 20]
-        finger_pips = [3, 6, 10, 14, 18]
-
-        extended_fingers = 0
-        finger_states = []
-        wrist = landmarks[0]
-
-        for i, (tip, pip) in enumerate(zip(finger_tips, finger_pips)):
-            if i == 0:  # Thumb - make it harder to be "extended"
-                thumb_wrist_dist = self.calculate_distance(landmarks[tip], wrist)
-                thumb_pip_wrist_dist = self.calculate_distance(landmarks[pip], wrist)
-                if thumb_wrist_dist > thumb_pip_wrist_dist + 0.03:  # Increased from 0.02
-                    extended_fingers += 1
-                    finger_states.append(True)
-                else:
-                    finger_states.append(False)
-            else:  # Other fingers - make it easier to be "extended"
-                if landmarks[tip][1] < landmarks[pip][1] + 0.01:  # Reduced from 0.02
-                    extended_fingers += 1
-                    finger_states.append(True)
-                else:
-                    finger_states.append(False)
-
-        return extended_fingers, finger_states
-
-    def detect_fist(self, landmarks):
-        """Simple fist detection using personal threshold"""
-        if self.fist_threshold is None:
-            return False
-        palm_center = landmarks[9]
-        fingertip_distances = []
-        for tip_idx in [4, 8, 12, 16, 20]:
-            dist = self.calculate_distance(landmarks[tip_idx], palm_center)
-            fingertip_distances.append(dist)
-
-        avg_distance = np.mean(fingertip_distances)
-        extended_count, _ = self.count_extended_fingers(landmarks)
-
-        return extended_count <= 1 and avg_distance < self.fist_threshold
+    def fingertip_palm_distance(self, landmarks):
+        """Mean distance from the five fingertips to the middle-finger base
+        (landmark 9) - small when the hand is closed. One vectorized
+        reduction; the fist threshold is calibrated against this value."""
+        return float(np.linalg.norm(landmarks[self._TIP_IDX] - landmarks[9], axis=1).mean())
 
-    def detect_open_hand(self, landmarks):
-        """Simple open hand detection"""
-        extended_count, _ = self.count_extended_fingers(landmarks)
+    def count_extended_fingers(self, landmarks):
+        """Count extended fingers with LOOSER thresholds for better two-finger detection.
+        The per-finger tests live in _finger_bits (thumb: tip clearly further
+        from the wrist than its joint, +0.03; others: tip above PIP, +0.01);
+        the bitmask is decoded via a table, so there's no per-finger loop here.
+        Returns (count, states) with states indexed thumb..pinky."""
+        return _FINGER_STATES[_finger_bits(landmarks)]
+
+    def detect_open_hand(self, landmarks, extended_count=None):
+        """Simple open hand detection. Pass extended_count if it was already
+        computed this frame to skip recounting."""
+        if extended_count is None:
+            extended_count, _ = self.count_extended_fingers(landmarks)
         return extended_count >= 3
 
     # ---- Limited mode (accessibility: move + single click, any hand pose) ----
@@ -4567,28 +5339,12 @@ class HandCenterGestureController:
         self._limited_click_armed = True
         self.prev_hand_center = None   # re-seed cleanly so a mode switch can't nudge
 
-    def _finger_pose_feature(self, landmarks):
-        """Fingertip positions relative to the wrist, normalized by hand size.
-        Because it's relative to the wrist and scaled by the palm, this isolates
-        finger articulation from where the hand is - so moving the hand to steer
-        the cursor barely changes it, but flicking a finger spikes it."""
-        wrist = landmarks[0]
-        mcp = landmarks[9]  # middle-finger base - stable hand-scale reference
-        scale = math.hypot(mcp[0] - wrist[0], mcp[1] - wrist[1]) or 1e-6
-        return [((landmarks[t][0] - wrist[0]) / scale,
-                 (landmarks[t][1] - wrist[1]) / scale)
-                for t in (4, 8, 12, 16, 20)]
-
     def _move_cursor_with_hand(self, hand_center):
         """Move the OS cursor to follow the hand - calibrated absolute mapping
         when available, else relative deltas. Mirrors the normal cursor-control
         path but with no open-hand requirement (used by Limited mode)."""
         if self.calibration is not None:
-            new_x, new_y = self.map_to_screen(hand_center[0], hand_center[1])
-            try:
-                pyautogui.moveTo(new_x, new_y, duration=0)
-            except Exception as e:
-                print(f"Cursor move failed: {e}")
+            self._cursor.move(*self.map_to_screen(hand_center[0], hand_center[1]))
         elif self.prev_hand_center is not None:
             hand_delta_x = hand_center[0] - self.prev_hand_center[0]
             hand_delta_y = hand_center[1] - self.prev_hand_center[1]
@@ -4596,20 +5352,16 @@ class HandCenterGestureController:
             if abs(hand_delta_x) > norm_dz or abs(hand_delta_y) > norm_dz:
                 screen_delta_x = hand_delta_x * self.screen_width * self.sensitivity
                 screen_delta_y = hand_delta_y * self.screen_height * self.sensitivity
-                try:
-                    current_x, current_y = pyautogui.position()
-                    new_x = max(self.screen_edge_margin, min(self.screen_width - self.screen_edge_margin, current_x + screen_delta_x))
-                    new_y = max(self.screen_edge_margin, min(self.screen_height - self.screen_edge_margin, current_y + screen_delta_y))
-                    pyautogui.moveTo(new_x, new_y, duration=0)
-                except Exception as e:
-                    print(f"Cursor move failed: {e}")
+                current_x, current_y = self._cursor.position()
+                new_x = max(self.screen_edge_margin, min(self.screen_width - self.screen_edge_margin, current_x + screen_delta_x))
+                new_y = max(self.screen_edge_margin, min(self.screen_height - self.screen_edge_margin, current_y + screen_delta_y))
+                self._cursor.move(new_x, new_y)
         self.prev_hand_center = hand_center.copy()
 
     def _limited_mode_tick(self, landmarks, hand_center, current_time):
         """Simplified control for users with limited finger mobility: the cursor
         follows the hand in ANY pose, and a quick finger movement fires a single
         left click. No pinch/drag/scroll/fist/dwell - just move and click."""
-        feat = self._finger_pose_feature(landmarks)
         clicked = False
         # Thresholds derived from the Settings sensitivity slider. settle is a
         # fraction of flick so it's always below it (the re-arm band can't invert).
@@ -4619,13 +5371,14 @@ class HandCenterGestureController:
         if self._limited_baseline is None:
             # First frame with this hand - adopt its pose as the resting baseline
             # so we don't read the initial appearance as a flick.
-            self._limited_baseline = feat
+            self._limited_baseline = np.zeros((5, 2))
+            _flick_step(landmarks, self._limited_baseline, 1.0)
         else:
-            base = self._limited_baseline
-            # How far the fingers have deviated from the slow-moving resting pose.
-            deviation = sum(math.hypot(feat[i][0] - base[i][0],
-                                       feat[i][1] - base[i][1])
-                            for i in range(len(feat)))
+            # How far the fingers have deviated from the slow-moving resting
+            # pose. The kernel also lets the baseline drift toward the current
+            # pose (alpha 0.15) so a deliberately held position re-arms instead
+            # of latching a click forever.
+            deviation = _flick_step(landmarks, self._limited_baseline, 0.15)
             if (self._limited_click_armed and
                     deviation > flick_threshold and
                     current_time - self.last_action_time > self.action_cooldown):
@@ -4634,20 +5387,12 @@ class HandCenterGestureController:
                 self.last_action_time = current_time
                 self._limited_click_armed = False
                 clicked = True
-                print("Limited click")
+                if self.debug:
+                    self._debug_log("Limited click")
             elif not self._limited_click_armed and deviation < settle_threshold:
                 # Fingers returned to rest - ready for the next click.
                 self._limited_click_armed = True
 
-            # Let the baseline drift toward the current pose so a deliberately
-            # held position re-arms instead of latching a click forever.
-            alpha = 0.15
-            self._limited_baseline = [
-                (base[i][0] * (1 - alpha) + feat[i][0] * alpha,
-                 base[i][1] * (1 - alpha) + feat[i][1] * alpha)
-                for i in range(len(feat))
-            ]
-
         self._move_cursor_with_hand(hand_center)
         return "left_click" if clicked else "cursor_control"
 
@@ -4672,7 +5417,7 @@ class HandCenterGestureController:
         a short dwell in the zone (so passing through doesn't scroll) and is
         rate-limited so it scrolls gently. Returns True if it scrolled."""
         try:
-            _cx, cy = pyautogui.position()
+            _cx, cy = self._cursor.position()
         except Exception:
             return False
         edge = 50  # px from top/bottom that counts as the scroll zone
@@ -4687,6 +5432,7 @@ class HandCenterGestureController:
         if current_time - self._kids_last_scroll < 0.12:   # gentle, fps-independent
             return True
         try:
+            self._cursor.flush()
             pyautogui.scroll(2 if in_top else -2)
             self._emit_click("scroll")
         except Exception:
@@ -4705,13 +5451,10 @@ class HandCenterGestureController:
             return
         dx = (sc[0] - self.prev_hand_center[0]) * self.screen_width * KIDS_GAIN
         dy = (sc[1] - self.prev_hand_center[1]) * self.screen_height * KIDS_GAIN
-        try:
-            cx, cy = pyautogui.position()
-            nx = max(self.screen_edge_margin, min(self.screen_width - self.screen_edge_margin, cx + dx))
-            ny = max(self.screen_edge_margin, min(self.screen_height - self.screen_edge_margin, cy + dy))
-            pyautogui.moveTo(nx, ny, duration=0)
-        except Exception as e:
-            print(f"Cursor move failed: {e}")
+        cx, cy = self._cursor.position()
+        nx = max(self.screen_edge_margin, min(self.screen_width - self.screen_edge_margin, cx + dx))
+        ny = max(self.screen_edge_margin, min(self.screen_height - self.screen_edge_margin, cy + dy))
+        self._cursor.move(nx, ny)
         self.prev_hand_center = list(sc)
 
     def _kids_mode_tick(self, landmarks, hand_center, current_time):
@@ -4748,11 +5491,12 @@ class HandCenterGestureController:
                 self.last_action_time = current_time
                 self._kids_click_armed = False   # must reopen (move) before next click
                 self._kids_close_start = None
-                print("Kids click")
+                if self.debug:
+                    self._debug_log("Kids click")
                 return "left_click"
             if ov is not None and self._kids_click_armed:
                 try:
-                    hx, hy = pyautogui.position()
+                    hx, hy = self._cursor.position()
                     ov.set_hold(hx, hy, held / self.kids_click_hold)
                 except Exception:
                     pass
@@ -4777,21 +5521,30 @@ class HandCenterGestureController:
         self._kids_edge_scroll(current_time)   # after the move, on the new position
         return "cursor_control"
 
-    def detect_face_and_gaze(self, frame):
-        """Detect if user's face is visible and roughly looking at screen"""
+    def detect_face_and_gaze(self, rgb_frame):
+        """Detect if user's face is visible and roughly looking at screen.
+        Takes the same RGB frame the hand model gets, so the face mesh
+        doesn't need a second BGR->RGB conversion of the full-size image.
+        (It's unmirrored; the checks below are symmetric in x.)"""
         # If gaze detection is disabled, always return True
         if not self.gaze_detection_enabled:
             self.face_detected = True
             self.looking_at_screen = True
             return True
 
-        # If face_mesh is not initialized, return True (fallback)
         if self.face_mesh is None:
-            self.face_detected = True
-            self.looking_at_screen = True
-            return True
+            try:
+                self._create_face_mesh()
+            except Exception as e:
+                # Don't retry (and fail) on every frame: turn the feature off.
+                print(f"Gaze detection unavailable: {e}")
+                self.gaze_detection_enabled = False
+                return True
+
+        self._gaze_frame_idx += 1
+        if self._gaze_frame_idx % self.gaze_every:
+            return self.face_detected and self.looking_at_screen
 
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         face_results = self.face_mesh.process(rgb_frame)
 
         face_detected = False
@@ -4825,20 +5578,53 @@ class HandCenterGestureController:
                 break
 
         # Update detection history for smoothing
-        self.face_detection_history.append((face_detected, looking_forward))
+        self._face_bits = ((self._face_bits << 1) | face_detected) & 0x1F
+        self._gaze_bits = ((self._gaze_bits << 1) | looking_forward) & 0x1F
+        if self._face_samples < 5:
+            self._face_samples += 1
 
         # Smooth decision based on recent history
-        recent_detections = list(self.face_detection_history)
-        if len(recent_detections) >= 3:
-            face_count = sum(1 for fd, _ in recent_detections if fd)
-            gaze_count = sum(1 for _, lf in recent_detections if lf)
-
+        if self._face_samples >= 3:
             # Need majority of recent frames to have face + forward gaze
-            self.face_detected = face_count >= 3
-            self.looking_at_screen = gaze_count >= 2
+            self.face_detected = self._face_bits.bit_count() >= 3
+            self.looking_at_screen = self._gaze_bits.bit_count() >= 2
 
         return self.face_detected and self.looking_at_screen
 
+    def _create_face_mesh(self):
+        """Load the FaceMesh model for the gaze check (a few hundred ms).
+        No iris refinement: the check only reads the nose tip and eye corners,
+        and the refinement model is a second network on every processed frame."""
+        self.mp_face_mesh = mp.solutions.face_mesh
+        self.face_mesh = self.mp_face_mesh.FaceMesh(
+            static_image_mode=False,
+            max_num_faces=1,
+            refine_landmarks=False,
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.5
+        )
+
+    def _debug_log(self, msg):
+        """Queue a --debug line for the next _flush_debug_log."""
+        self._debug_lines.append(msg)
+
+    def _flush_debug_log(self):
+        lines = self._debug_lines
+        if not lines:
+            return
+        out = []
+        while lines:
+            out.append(lines.popleft())
+        try:
+            sys.stdout.write("\n".join(out) + "\n")
+            sys.stdout.flush()
+        except Exception:
+            pass
+
+    def _reset_smoothing(self):
+        """Restart the cursor filter from the next sample."""
+        self._cursor_primed = False
+
     def _reset_dwell(self):
         """Reset dwell-click state."""
         self.dwell_reference_pos = None
@@ -4854,9 +5640,11 @@ class HandCenterGestureController:
         # Otherwise, check if user is looking at screen
         return self.looking_at_screen
 
-    def detect_two_finger_scroll(self, landmarks):
-        """Detect two-finger scroll gesture - index and middle up, IGNORE thumb position"""
-        extended_count, finger_states = self.count_extended_fingers(landmarks)
+    def detect_two_finger_scroll(self, landmarks, finger_states=None):
+        """Detect two-finger scroll gesture - index and middle up, IGNORE thumb position.
+        Pass finger_states if already computed this frame to skip recounting."""
+        if finger_states is None:
+            _, finger_states = self.count_extended_fingers(landmarks)
 
         # Check: index + middle up, ring + pinky down, IGNORE thumb completely
         is_two_finger_pose = (
@@ -4871,15 +5659,12 @@ class HandCenterGestureController:
             # Out of pose - require a fresh run of in-pose frames before re-arming.
             self.scroll_enter_counter = 0
             # Only reset if we've been out of pose for a bit (sticky mode)
-            if not hasattr(self, 'scroll_exit_counter'):
-                self.scroll_exit_counter = 0
-
             self.scroll_exit_counter += 1
 
             # Give it 3 frames of grace before exiting (prevents accidental exits)
             if self.scroll_exit_counter > 3:
-                if self.scroll_reference_y is not None:
-                    print("📱 Exiting scroll mode")
+                if self.debug and self.scroll_reference_y is not None:
+                    self._debug_log("📱 Exiting scroll mode")
                 self.scroll_reference_y = None
                 self.scroll_accumulated = 0
                 self.scroll_exit_counter = 0
@@ -4905,7 +5690,8 @@ class HandCenterGestureController:
                 return False
             self.scroll_reference_y = current_fingers_y
             self.scroll_accumulated = 0
-            print("📱 Two-finger scroll mode activated")
+            if self.debug:
+                self._debug_log("📱 Two-finger scroll mode activated")
             return True
 
         # Calculate movement since reference
@@ -4936,7 +5722,8 @@ class HandCenterGestureController:
             # Perform the scroll
             pyautogui.scroll(scroll_amount)
             self._emit_click("scroll")
-            print(f"📜 Two-finger scroll {direction} (movement: {self.scroll_accumulated:.3f})")
+            if self.debug:
+                self._debug_log(f"📜 Two-finger scroll {direction} (movement: {self.scroll_accumulated:.3f})")
 
             # Reset accumulator but keep reference for continuous scrolling
             self.scroll_accumulated = 0
@@ -4944,8 +5731,11 @@ class HandCenterGestureController:
 
         return True
 
-    def detect_gestures(self, landmarks):
-        """Gesture detection using HAND CENTER tracking - respects gaze setting"""
+    def detect_gestures(self, landmarks, hand_center=None):
+        """Gesture detection using HAND CENTER tracking - respects gaze setting.
+        hand_center may be passed in when the caller already computed it for
+        this frame (_select_hand does); everything else derived from the
+        landmarks is computed once here and handed to the helpers."""
 
         # SAFETY CHECK: Only proceed if it's safe to control
         if not self.is_safe_to_control():
@@ -4953,10 +5743,9 @@ class HandCenterGestureController:
             if self.is_dragging:
                 try:
                     pyautogui.mouseUp(button='left')
-                    if self.gaze_detection_enabled:
-                        print("🛑 SAFETY: Stopped drag - user not looking at screen")
-                    else:
-                        print("🛑 Stopped drag")
+                    if self.debug:
+                        self._debug_log("🛑 SAFETY: Stopped drag - user not looking at screen"
+                                        if self.gaze_detection_enabled else "🛑 Stopped drag")
                 except Exception:
                     pass
                 self.is_dragging = False
@@ -4966,19 +5755,15 @@ class HandCenterGestureController:
 
             # Reset scroll mode
             if self.scroll_reference_y is not None:
-                if self.gaze_detection_enabled:
-                    print("🛑 SAFETY: Exited scroll - user not looking at screen")
-                else:
-                    print("🛑 Exited scroll")
+                if self.debug:
+                    self._debug_log("🛑 SAFETY: Exited scroll - user not looking at screen"
+                                    if self.gaze_detection_enabled else "🛑 Exited scroll")
                 self.scroll_reference_y = None
                 self.scroll_accumulated = 0
 
             # Reset other states
             self.prev_hand_center = None
-            self.smoothed_screen_pos = None
-            self._smoothed_pass2 = None
-            self._prev_raw_pos = None
-            self._last_output_pos = None
+            self._reset_smoothing()
             self._pinch_active = False
             self.scroll_enter_counter = 0
             self.dwell_reference_pos = None
@@ -4988,10 +5773,15 @@ class HandCenterGestureController:
             self._reset_kids()
             return "safety_disabled" if self.gaze_detection_enabled else "disabled"
 
-        current_time = time.time()
+        # Monotonic: the pinch/drag/dwell/cooldown timers below only measure
+        # intervals, and a wall-clock step (NTP sync, DST, manual change) must
+        # not fire or swallow a click. Sampled once; everything downstream
+        # (kids/limited ticks included) gets this value.
+        current_time = time.monotonic()
 
         # Calculate hand center
-        hand_center = self.calculate_hand_center(landmarks)
+        if hand_center is None:
+            hand_center = self.calculate_hand_center(landmarks)
 
         # KIDS MODE: open hand = move (heavily smoothed), close = click, hover
         # screen edge = scroll. LIMITED MODE: cursor follows hand in any pose +
@@ -5002,37 +5792,40 @@ class HandCenterGestureController:
         if self.limited_mode:
             return self._limited_mode_tick(landmarks, hand_center, current_time)
 
-        # Get key finger positions for pinch detection
-        thumb_tip = landmarks[4]
-        index_tip = landmarks[8]
-
-        # Calculate pinch - with Schmitt-trigger hysteresis. Enter the pinched
+        # Profile values read on most branches below, bound once per frame.
+        # They only change between frames (wizard / settings panel), never
+        # during one, and locals skip an attribute lookup on every use.
+        drag_threshold = self.drag_threshold
+        cooldown = self.action_cooldown
+        sw, sh = self.screen_width, self.screen_height
+        margin = self.screen_edge_margin
+        sens = self.sensitivity
+
+        # Classify pinch + fist in one numeric kernel (JIT-compiled when numba
+        # is available). Pinch uses Schmitt-trigger hysteresis: enter the pinched
         # state below the threshold, but only LEAVE it once the fingers open past
         # threshold * 1.25. A single hard compare made a hand resting near the
         # threshold flicker pinched/unpinched every frame, firing false clicks and
         # flickering drag start/stop - the hysteresis band absorbs that jitter.
-        pinch_distance = self.calculate_distance(thumb_tip, index_tip)
-        if self.pinch_threshold is None:
-            self._pinch_active = False
-        elif self._pinch_active:
-            if pinch_distance > self.pinch_threshold * 1.25:
-                self._pinch_active = False
-        else:
-            if pinch_distance < self.pinch_threshold:
-                self._pinch_active = True
-        is_pinched = self._pinch_active
-
-        extended_count, finger_states = self.count_extended_fingers(landmarks)
+        pose = _classify_pose(
+            landmarks, self._pinch_active,
+            self.pinch_threshold if self.pinch_threshold is not None else -1.0,
+            self.fist_threshold if self.fist_threshold is not None else -1.0)
+        is_pinched = self._pinch_active = bool(pose & _POSE_PINCH)
+        extended_count, finger_states = _FINGER_STATES[pose & 0x1F]
 
         # 1. FIST DETECTION for RIGHT CLICK
-        is_fist = self.detect_fist(landmarks)
-        self.fist_history.append(is_fist)
-
-        if len(self.fist_history) >= 5:
-            recent_states = list(self.fist_history)[-5:]
-            if (not recent_states[-1] and not recent_states[-2] and
-                any(recent_states[:-2]) and
-                current_time - self.last_action_time > self.action_cooldown):
+        is_fist = bool(pose & _POSE_FIST)
+        fist_bits = self.fist_bits = ((self.fist_bits << 1) | is_fist) & 0xFF
+        if self._fist_frames < 5:
+            self._fist_frames += 1
+
+        # Release edge over the last 5 frames: open for the latest two
+        # (bits 0-1 clear) after a fist in any of the three before (bits 2-4).
+        if self._fist_frames >= 5:
+            if ((fist_bits & 0b00011) == 0 and
+                (fist_bits & 0b11100) != 0 and
+                current_time - self.last_action_time > cooldown):
 
                 self._do_action(self.gesture_actions.get("fist", "right_click"))
                 self.last_action_time = current_time
@@ -5044,28 +5837,31 @@ class HandCenterGestureController:
             # Start timing pinch
             if self.pinch_start_time is None:
                 self.pinch_start_time = current_time
-                print("🤏 Pinch started - timing...")
+                if self.debug:
+                    self._debug_log("🤏 Pinch started - timing...")
 
             pinch_duration = current_time - self.pinch_start_time
 
             # Start drag after threshold
-            if pinch_duration >= self.drag_threshold and not self.is_dragging:
+            if pinch_duration >= drag_threshold and not self.is_dragging:
                 try:
                     # Get current screen position
-                    current_screen_x, current_screen_y = pyautogui.position()
+                    current_screen_x, current_screen_y = self._cursor.position()
 
                     # Store HAND CENTER position at drag start
                     self.drag_start_hand_pos = hand_center.copy()
                     self.drag_start_screen_pos = [current_screen_x, current_screen_y]
 
                     # Start drag
+                    self._cursor.flush()
                     pyautogui.mouseDown(button='left')
                     self._emit_click("drag")
                     self.is_dragging = True
                     self.last_action_time = current_time
 
-                    print(f"🖱️ DRAG STARTED! Hand center at ({hand_center[0]:.4f}, {hand_center[1]:.4f})")
-                    print(f"🖱️ Screen position: ({current_screen_x}, {current_screen_y})")
+                    if self.debug:
+                        self._debug_log(f"🖱️ DRAG STARTED! Hand center at ({hand_center[0]:.4f}, {hand_center[1]:.4f})")
+                        self._debug_log(f"🖱️ Screen position: ({current_screen_x}, {current_screen_y})")
 
                     self._reset_dwell()
                     return "drag_started"
@@ -5083,29 +5879,25 @@ class HandCenterGestureController:
                     # Fallback: delta-based drag movement
                     hand_delta_x = hand_center[0] - self.drag_start_hand_pos[0]
                     hand_delta_y = hand_center[1] - self.drag_start_hand_pos[1]
-                    screen_delta_x = hand_delta_x * self.screen_width * 3.0
-                    screen_delta_y = hand_delta_y * self.screen_height * 3.0
+                    screen_delta_x = hand_delta_x * sw * 3.0
+                    screen_delta_y = hand_delta_y * sh * 3.0
                     new_screen_x = self.drag_start_screen_pos[0] + screen_delta_x
                     new_screen_y = self.drag_start_screen_pos[1] + screen_delta_y
-                    new_screen_x = max(self.screen_edge_margin, min(self.screen_width - self.screen_edge_margin, new_screen_x))
-                    new_screen_y = max(self.screen_edge_margin, min(self.screen_height - self.screen_edge_margin, new_screen_y))
+                    new_screen_x = max(margin, min(sw - margin, new_screen_x))
+                    new_screen_y = max(margin, min(sh - margin, new_screen_y))
 
-                try:
-                    pyautogui.moveTo(new_screen_x, new_screen_y, duration=0)
-
-                    actual_x, actual_y = pyautogui.position()
-                    total_moved = abs(actual_x - self.drag_start_screen_pos[0]) + abs(actual_y - self.drag_start_screen_pos[1])
+                self._cursor.move(new_screen_x, new_screen_y)
 
+                if self.debug:
+                    # Use the position just sent - no need to ask the OS back.
+                    total_moved = abs(new_screen_x - self.drag_start_screen_pos[0]) + abs(new_screen_y - self.drag_start_screen_pos[1])
                     if total_moved > 5:
-                        print(f"🖱️ Dragging → screen ({actual_x},{actual_y}) [moved {total_moved:.0f}px]")
-
-                except Exception as e:
-                    print(f"❌ Drag move failed: {e}")
+                        self._debug_log(f"🖱️ Dragging → screen ({new_screen_x:.0f},{new_screen_y:.0f}) [moved {total_moved:.0f}px]")
 
                 return "dragging"
 
             # Waiting for drag threshold
-            remaining = self.drag_threshold - pinch_duration
+            remaining = drag_threshold - pinch_duration
             if remaining > 0:
                 return f"pinch_waiting_{remaining:.1f}"
 
@@ -5117,13 +5909,14 @@ class HandCenterGestureController:
                 # End drag if was dragging
                 if self.is_dragging:
                     try:
+                        self._cursor.flush()
                         pyautogui.mouseUp(button='left')
 
                         # Calculate total drag distance
-                        if self.drag_start_screen_pos is not None:
-                            final_x, final_y = pyautogui.position()
+                        if self.debug and self.drag_start_screen_pos is not None:
+                            final_x, final_y = self._cursor.position()
                             total_distance = abs(final_x - self.drag_start_screen_pos[0]) + abs(final_y - self.drag_start_screen_pos[1])
-                            print(f"🖱️ DRAG ENDED! Total distance: {total_distance} pixels")
+                            self._debug_log(f"🖱️ DRAG ENDED! Total distance: {total_distance} pixels")
 
                         self.is_dragging = False
                         self.drag_start_hand_pos = None
@@ -5139,13 +5932,14 @@ class HandCenterGestureController:
                         return "drag_end_failed"
 
                 # Quick click if short pinch
-                elif (pinch_duration < self.drag_threshold and
-                      current_time - self.last_action_time > self.action_cooldown):
+                elif (pinch_duration < drag_threshold and
+                      current_time - self.last_action_time > cooldown):
 
                     try:
                         self._do_action(self.gesture_actions.get("pinch", "left_click"))
                         self.last_action_time = current_time
-                        print("🖱️ CLICK!")
+                        if self.debug:
+                            self._debug_log("🖱️ CLICK!")
                         self.pinch_start_time = None
                         self._reset_dwell()
                         return "pinch_click"
@@ -5158,13 +5952,13 @@ class HandCenterGestureController:
 
         # 3. TWO-FINGER SCROLL DETECTION
         if not is_pinched and not self.is_dragging:
-            if self.detect_two_finger_scroll(landmarks):
+            if self.detect_two_finger_scroll(landmarks, finger_states):
                 if self.scroll_reference_y is not None:
                     self._reset_dwell()
                     return "two_finger_scroll"
 
         # 4. NORMAL CURSOR CONTROL using HAND CENTER
-        if not is_pinched and not self.is_dragging and self.detect_open_hand(landmarks):
+        if not is_pinched and not self.is_dragging and self.detect_open_hand(landmarks, extended_count):
 
             # Don't control cursor if in scroll mode
             if self.scroll_reference_y is not None:
@@ -5172,52 +5966,42 @@ class HandCenterGestureController:
 
             if self.calibration is not None:
                 # Absolute mapping via calibration bounding box
-                new_x, new_y = self.map_to_screen(hand_center[0], hand_center[1])
-                try:
-                    pyautogui.moveTo(new_x, new_y, duration=0)
-                except Exception as e:
-                    print(f"❌ Cursor move failed: {e}")
+                self._cursor.move(*self.map_to_screen(hand_center[0], hand_center[1]))
             elif self.prev_hand_center is not None:
                 # Fallback: relative delta-based movement (no calibration)
                 hand_delta_x = hand_center[0] - self.prev_hand_center[0]
                 hand_delta_y = hand_center[1] - self.prev_hand_center[1]
 
                 # Convert pixel dead zone to normalized hand-coordinate threshold
-                norm_dz = self.cursor_dead_zone / (max(self.screen_width, self.screen_height) * self.sensitivity)
+                norm_dz = self.cursor_dead_zone / (max(sw, sh) * sens)
                 if abs(hand_delta_x) > norm_dz or abs(hand_delta_y) > norm_dz:
-                    screen_delta_x = hand_delta_x * self.screen_width * self.sensitivity
-                    screen_delta_y = hand_delta_y * self.screen_height * self.sensitivity
+                    screen_delta_x = hand_delta_x * sw * sens
+                    screen_delta_y = hand_delta_y * sh * sens
 
-                    try:
-                        current_x, current_y = pyautogui.position()
-                        new_x = max(self.screen_edge_margin, min(self.screen_width - self.screen_edge_margin, current_x + screen_delta_x))
-                        new_y = max(self.screen_edge_margin, min(self.screen_height - self.screen_edge_margin, current_y + screen_delta_y))
-
-                        pyautogui.moveTo(new_x, new_y, duration=0)
-                    except Exception as e:
-                        print(f"❌ Cursor move failed: {e}")
+                    current_x, current_y = self._cursor.position()
+                    new_x = max(margin, min(sw - margin, current_x + screen_delta_x))
+                    new_y = max(margin, min(sh - margin, current_y + screen_delta_y))
+                    self._cursor.move(new_x, new_y)
 
             # Update previous HAND CENTER position
             self.prev_hand_center = hand_center.copy()
 
             # 5. DWELL-CLICK: if cursor stays still long enough, click
             if self.dwell_click_enabled:
-                current_pos = pyautogui.position()
+                current_pos = self._cursor.position()
                 if self.dwell_reference_pos is None:
                     self.dwell_reference_pos = current_pos
                     self.dwell_start_time = current_time
                     self.dwell_triggered = False
                 else:
-                    dist = math.sqrt(
-                        (current_pos[0] - self.dwell_reference_pos[0]) ** 2 +
-                        (current_pos[1] - self.dwell_reference_pos[1]) ** 2
-                    )
+                    dx = current_pos[0] - self.dwell_reference_pos[0]
+                    dy = current_pos[1] - self.dwell_reference_pos[1]
                     # Re-arm hysteresis: once a dwell click has fired, the cursor
                     # must move CLEARLY away (2x radius) before another can fire,
                     # so an edge-of-radius tremor wobble can't repeat-click a target.
                     exit_radius = (self.dwell_click_radius * 2.0
                                    if self.dwell_triggered else self.dwell_click_radius)
-                    if dist > exit_radius:
+                    if dx * dx + dy * dy > exit_radius * exit_radius:
                         # Cursor moved outside radius - reset
                         self.dwell_reference_pos = current_pos
                         self.dwell_start_time = current_time
@@ -5230,7 +6014,8 @@ class HandCenterGestureController:
                             self.dwell_triggered = True
                             # Reset timer so moving cursor out and back allows another click
                             self.dwell_start_time = current_time
-                            print(f"DWELL CLICK at ({current_pos[0]}, {current_pos[1]})")
+                            if self.debug:
+                                self._debug_log(f"DWELL CLICK at ({current_pos[0]}, {current_pos[1]})")
                             return "dwell_click"
 
             return "cursor_control"
@@ -5239,203 +6024,24 @@ class HandCenterGestureController:
             # Reset hand center tracking when not controlling cursor (unless dragging)
             if not self.is_dragging:
                 self.prev_hand_center = None
-                self.smoothed_screen_pos = None
-                self._smoothed_pass2 = None
-                self._prev_raw_pos = None
-                self._last_output_pos = None
+                self._reset_smoothing()
 
         return "idle"
 
-    def draw_debug_info(self, frame, landmarks, gesture, extended_count, finger_states):
-        """Debug visualization with toggleable gaze detection status"""
-        frame_height, frame_width = frame.shape[:2]
-
-        # Calculate hand center
-        hand_center = self.calculate_hand_center(landmarks)
-
-        # Get finger positions for pinch visualization
-        thumb_tip = landmarks[4]
-        index_tip = landmarks[8]
-        middle_tip = landmarks[12]
-
-        pinch_distance = self.calculate_distance(thumb_tip, index_tip)
-        is_pinched = self.pinch_threshold is not None and pinch_distance < self.pinch_threshold
-
-        # Clean background - larger for gaze info
-        cv2.rectangle(frame, (10, 10), (650, 300), (0, 0, 0), -1)
-
-        # GAZE DETECTION STATUS
-        if self.gaze_detection_enabled:
-            gaze_color = (0, 255, 0) if self.looking_at_screen else (0, 0, 255)
-            gaze_text = "ACTIVE" if self.looking_at_screen else "DISABLED"
-            cv2.putText(frame, f"👁️ Gaze Control: {gaze_text}", (20, 30),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, gaze_color, 2)
-
-            face_status = "DETECTED" if self.face_detected else "NOT FOUND"
-            face_color = (255, 255, 255) if self.face_detected else (100, 100, 100)
-            cv2.putText(frame, f"Face: {face_status}", (20, 60),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, face_color, 2)
-        else:
-            cv2.putText(frame, "👁️ Gaze Control: OFF (Always Active)", (20, 30),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
-            cv2.putText(frame, "Press 'g' to enable gaze detection", (20, 60),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 2)
-
-        # Current gesture
-        if self.is_safe_to_control():
-            color = (0, 255, 0) if gesture != "idle" else (255, 255, 255)
-            if "drag" in gesture:
-                color = (255, 0, 128)  # Pink for drag
-            elif "pinch_waiting" in gesture:
-                color = (255, 128, 0)  # Orange for waiting
-            elif "two_finger_scroll" in gesture or "scroll_mode" in gesture:
-                color = (0, 255, 255)  # Cyan for scroll
-            elif gesture == "dwell_click":
-                color = (0, 200, 100)  # Green for dwell click
-        else:
-            color = (100, 100, 100)  # Gray when disabled
-            gesture = "safety_disabled" if self.gaze_detection_enabled else "disabled"
-
-        cv2.putText(frame, f"Gesture: {gesture}", (20, 90),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
-
-        # HAND CENTER focus (only show if active)
-        if self.is_safe_to_control():
-            cv2.putText(frame, f"Hand Center: ({hand_center[0]:.4f}, {hand_center[1]:.4f})", (20, 120),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 2)
-
-        # Two-finger scroll status
-        if self.scroll_reference_y is not None and self.is_safe_to_control():
-            cv2.putText(frame, f"📱 SCROLL MODE - Move 2 fingers up/down", (20, 150),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
-            cv2.putText(frame, f"Ref Y: {self.scroll_reference_y:.4f}, Acc: {self.scroll_accumulated:.3f}", (20, 180),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
-
-        # Drag state
-        elif self.is_dragging and self.is_safe_to_control():
-            cv2.putText(frame, "🖱️ ACTIVELY DRAGGING!", (20, 150),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 0, 128), 2)
-            if self.drag_start_hand_pos is not None:
-                start_x, start_y = self.drag_start_hand_pos
-                cv2.putText(frame, f"Drag start: ({start_x:.4f}, {start_y:.4f})", (20, 180),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
-        elif self.pinch_start_time is not None and self.is_safe_to_control():
-            remaining = max(0, self.drag_threshold - (time.time() - self.pinch_start_time))
-            if remaining > 0:
-                cv2.putText(frame, f"Hold {remaining:.1f}s more for drag", (20, 150),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 2)
-
-        # Show control status
-        elif not self.is_safe_to_control():
-            if self.gaze_detection_enabled:
-                cv2.putText(frame, "👁️ Look at screen to activate controls", (20, 150),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 128, 0), 2)
-            else:
-                cv2.putText(frame, "✋ Controls active (gaze detection OFF)", (20, 150),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-
-        # Extended fingers info (always show for debugging)
-        is_open_hand = self.detect_open_hand(landmarks)
-        cv2.putText(frame, f"Extended fingers: {extended_count}/5", (20, 210),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
-
-        # Show finger states for two-finger detection (highlight thumb ignorance)
-        finger_names = ["Thumb*", "Index", "Middle", "Ring", "Pinky"]
-        finger_text = ""
-        for i, (name, state) in enumerate(zip(finger_names, finger_states)):
-            status = "✓" if state else "✗"
-            if i == 0:  # Thumb
-                finger_text += f"{name}: {status}(ignored) | "
-            else:
-                finger_text += f"{name}: {status} | "
-
-        cv2.putText(frame, finger_text[:-3], (20, 230),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.4, (200, 200, 200), 1)
-
-        open_hand_color = (0, 255, 0) if is_open_hand else (255, 0, 0)
-        cv2.putText(frame, f"Open hand: {'YES' if is_open_hand else 'NO'}", (20, 250),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, open_hand_color, 2)
-
-        # Dwell-click status
-        dwell_color = (0, 200, 100) if self.dwell_click_enabled else (100, 100, 100)
-        dwell_text = f"Dwell: {'ON' if self.dwell_click_enabled else 'OFF'} ({self.dwell_click_duration}s, {self.dwell_click_radius}px) | 'd' to toggle"
-        cv2.putText(frame, dwell_text, (20, 270),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.4, dwell_color, 1)
-
-        # Instructions
-        if self.gaze_detection_enabled:
-            cv2.putText(frame, "GAZE MODE | 'g'=toggle gaze, 'c'=profile, 'd'=dwell, 'q'=quit", (20, 290),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.4, (0, 255, 255), 1)
-        else:
-            cv2.putText(frame, "FREE MODE | 'g'=toggle gaze, 'c'=profile, 'd'=dwell, 'q'=quit", (20, 290),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 0), 1)
-
-        # Visual indicators
-        hand_center_pos = (int(hand_center[0] * frame_width), int(hand_center[1] * frame_height))
-        thumb_pos = (int(thumb_tip[0] * frame_width), int(thumb_tip[1] * frame_height))
-        index_pos = (int(index_tip[0] * frame_width), int(index_tip[1] * frame_height))
-        middle_pos = (int(middle_tip[0] * frame_width), int(middle_tip[1] * frame_height))
-
-        # Only show active visuals when safe to control
-        if self.is_safe_to_control():
-            # Pinch line
-            line_color = (255, 0, 128) if self.is_dragging else (0, 255, 0) if is_pinched else (255, 255, 255)
-            line_thickness = 6 if self.is_dragging else 3 if is_pinched else 2
-            cv2.line(frame, thumb_pos, index_pos, line_color, line_thickness)
-
-            # Two-finger scroll indicators
-            if self.scroll_reference_y is not None:
-                # Highlight the two scroll fingers
-                cv2.circle(frame, index_pos, 15, (0, 255, 255), 4)
-                cv2.circle(frame, middle_pos, 15, (0, 255, 255), 4)
-                cv2.line(frame, index_pos, middle_pos, (0, 255, 255), 4)
-                cv2.putText(frame, "SCROLL", (index_pos[0] + 20, index_pos[1] - 20),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
-
-            # Highlight HAND CENTER as the main tracking point
-            center_color = (255, 0, 128) if self.is_dragging else (0, 255, 255) if self.scroll_reference_y else (0, 255, 255)
-            center_size = 20 if self.is_dragging else 15
-            cv2.circle(frame, hand_center_pos, center_size, center_color, 4)
-            cv2.putText(frame, "HAND CENTER", (hand_center_pos[0] + 25, hand_center_pos[1] - 25),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, center_color, 2)
-
-            # Show drag start position if dragging
-            if self.is_dragging and self.drag_start_hand_pos is not None:
-                start_screen_x = int(self.drag_start_hand_pos[0] * frame_width)
-                start_screen_y = int(self.drag_start_hand_pos[1] * frame_height)
-                cv2.circle(frame, (start_screen_x, start_screen_y), 12, (255, 255, 0), 3)
-                cv2.line(frame, (start_screen_x, start_screen_y), hand_center_pos, (255, 255, 0), 3)
-                cv2.putText(frame, "START", (start_screen_x + 15, start_screen_y - 15),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 0), 2)
-
-            # Dwell-click progress indicator (radial arc around hand center)
-            if (self.dwell_click_enabled and self.dwell_start_time is not None
-                    and not self.dwell_triggered and self.dwell_reference_pos is not None):
-                elapsed = time.time() - self.dwell_start_time
-                progress = min(1.0, elapsed / self.dwell_click_duration)
-                if progress > 0.1:  # Only show after 10% to avoid flicker
-                    angle = int(360 * progress)
-                    dwell_color = (0, 255, 0) if progress < 0.9 else (0, 255, 255)
-                    cv2.ellipse(frame, hand_center_pos, (30, 30), -90, 0, angle, dwell_color, 3)
-                    cv2.putText(frame, f"DWELL {progress*100:.0f}%",
-                               (hand_center_pos[0] + 35, hand_center_pos[1] + 35),
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.4, dwell_color, 1)
-        else:
-            # Show dimmed hand when not safe to control
-            cv2.circle(frame, hand_center_pos, 10, (100, 100, 100), 2)
-            cv2.line(frame, thumb_pos, index_pos, (100, 100, 100), 1)
-
     def _update_preview(self, prev, frame, hand_results):
-        """Draw the detected hand(s) onto the (already mirrored) frame and push it
-        to the 'see yourself' window, with the controlling hand's Left/Right label.
-        Drawing happens in-place; the frame isn't reused after this point."""
+        """Draw the detected hand(s) onto the (unmirrored) frame and push it
+        to the 'see yourself' window, which mirrors it for display, with the
+        controlling hand's Left/Right label. Drawing happens in-place; the
+        frame isn't reused after this point."""
         label = None
         if hand_results.multi_hand_landmarks:
-            for hlm in hand_results.multi_hand_landmarks:
-                self.mp_draw.draw_landmarks(
-                    frame, hlm, self.mp_hands.HAND_CONNECTIONS,
-                    self.mp_draw.DrawingSpec(color=(255, 143, 171), thickness=2, circle_radius=3),
-                    self.mp_draw.DrawingSpec(color=(120, 170, 255), thickness=2))
+            if self.overlay_mode == "full":
+                for hlm in hand_results.multi_hand_landmarks:
+                    _draw_hand(frame, hlm, self._landmark_spec, self._connection_spec)
+            elif self.overlay_mode == "minimal" and self._tracked_hand_center is not None:
+                h, w = frame.shape[:2]
+                cx, cy = self._tracked_hand_center   # mirrored; map x back
+                cv2.circle(frame, (int((1.0 - cx) * w), int(cy * h)), 10, (255, 143, 171), 2)
             idx = getattr(self, "_selected_hand_idx", 0)
             mh = getattr(hand_results, "multi_handedness", None)
             if mh and 0 <= idx < len(mh):
@@ -5443,9 +6049,43 @@ class HandCenterGestureController:
                     label = mh[idx].classification[0].label
                 except Exception:
                     label = None
-        prev.show_frame(frame)
+                # MediaPipe labels handedness assuming a mirrored (selfie)
+                # image; this one isn't, so the label comes out swapped.
+                label = _SWAPPED_HAND.get(label)
+        prev.show_frame(frame, mirror=True)
         prev.set_hand(label)
 
+    def _infer_frame(self, rgb):
+        """MediaPipe for one frame, on the capture thread (see _FrameGrabber):
+        hand landmarks, honoring --infer-every / --skip-still, then the gaze
+        check, which updates face_detected / looking_at_screen for the tick.
+        Returns (hand_results, t_start, t_end), or None while paused.
+        The reuse state below is only touched from this thread."""
+        if self.paused:
+            return None
+        t_start = time.perf_counter()
+        self._frame_idx += 1
+        reuse = self._last_hand_results is not None and self._frame_idx % self.infer_every
+        if self.skip_still:
+            gray = cv2.cvtColor(cv2.resize(rgb, (160, 90), interpolation=cv2.INTER_AREA),
+                                cv2.COLOR_RGB2GRAY)
+            if (not reuse and self._last_hand_results is not None
+                    and self._prev_gray is not None
+                    and self._still_reuse < self.still_max_reuse
+                    and cv2.absdiff(gray, self._prev_gray).mean() < self.still_diff):
+                reuse = True
+                self._still_reuse += 1
+            elif not reuse:
+                self._still_reuse = 0
+            self._prev_gray = gray
+        if reuse:
+            hand_results = self._last_hand_results
+        else:
+            hand_results = self.hands.process(rgb)
+            self._last_hand_results = hand_results
+        self.detect_face_and_gaze(rgb)
+        return hand_results, t_start, time.perf_counter()
+
     def _tracking_tick(self):
         """Single frame of the tracking loop, driven by QTimer.
         Any exception inside is caught and logged. One bad frame from MediaPipe
@@ -5459,7 +6099,7 @@ class HandCenterGestureController:
                 if self.kids_mode and not self.paused:
                     try:
                         # grey the cursor once the hand has been gone a few frames
-                        _ov.set_cursor(*pyautogui.position(),
+                        _ov.set_cursor(*self._cursor.position(),
                                        active=(self._hand_lost_frames < 5))
                     except Exception:
                         pass
@@ -5471,12 +6111,12 @@ class HandCenterGestureController:
                 else:
                     _ov.clear_cursor()
             _bench = self._bench
-            _t0 = time.perf_counter() if _bench is not None else 0.0
-            _t1 = _t2 = 0.0
-            ret, frame = self.cap.read()
-            if not ret:
-                self._cam_fail_count = getattr(self, '_cam_fail_count', 0) + 1
-                if self._cam_fail_count >= 90:  # ~3 seconds at 30fps
+            # Frames come from the capture thread (_FrameGrabber): unmirrored
+            # (see __init__), run through MediaPipe (_infer_frame), and always
+            # the newest one.
+            latest = self._grabber.latest()
+            if latest is None or latest[0] == self._frame_seq:
+                if self._grabber.fail_count >= 90:  # ~3 seconds of failed reads
                     cam_url = (
                         "x-apple.systempreferences:com.apple.preference.security?Privacy_Camera"
                         if sys.platform == "darwin"
@@ -5493,13 +6133,12 @@ class HandCenterGestureController:
                         settings_url=cam_url,
                         settings_label="Open Camera Settings",
                     )
-                    return
-                return
-            self._cam_fail_count = 0
-
-            frame = cv2.flip(frame, 1)
-            if _bench is not None:
-                _t1 = time.perf_counter()
+                elif self._grabber.infer_fail_count >= 60:
+                    # Hand/gaze inference raises on every frame, so none are
+                    # published; same outcome as the tick failing repeatedly.
+                    self._tracking_failed()
+                return   # no new frame since the last tick
+            self._frame_seq, _t0, frame, inferred = latest
 
             if self.paused:
                 # Parked: release any held action, reset latches so nothing fires
@@ -5515,10 +6154,7 @@ class HandCenterGestureController:
                 self.drag_start_hand_pos = None
                 self.drag_start_screen_pos = None
                 self.prev_hand_center = None
-                self.smoothed_screen_pos = None
-                self._smoothed_pass2 = None
-                self._prev_raw_pos = None
-                self._last_output_pos = None
+                self._reset_smoothing()
                 self.scroll_reference_y = None
                 self.scroll_accumulated = 0
                 self.scroll_exit_counter = 0
@@ -5529,16 +6165,12 @@ class HandCenterGestureController:
                 self._last_gesture = "paused"
                 _prev = getattr(self, "_preview", None)
                 if _prev is not None and _prev.isVisible():
-                    _prev.show_frame(frame)
+                    _prev.show_frame(frame, mirror=True)
                     _prev.set_hand(None)
                 return
-
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-            hand_results = self.hands.process(rgb_frame)
-            if _bench is not None:
-                _t2 = time.perf_counter()
-            self.detect_face_and_gaze(frame)
+            if inferred is None:
+                return   # captured while paused - wait for a frame with results
+            hand_results, _t1, _t2 = inferred
 
             gesture = "no_hand"
 
@@ -5547,7 +6179,7 @@ class HandCenterGestureController:
                 # Control with exactly ONE hand (the student's), even if a helper's
                 # hand is also in frame - prevents the cursor jumping between hands.
                 landmarks = self._select_hand(hand_results.multi_hand_landmarks)
-                gesture = self.detect_gestures(landmarks)
+                gesture = self.detect_gestures(landmarks, self._tracked_hand_center)
             else:
                 self._hand_lost_frames += 1
                 self._tracked_hand_center = None   # re-lock fresh when a hand returns
@@ -5564,10 +6196,7 @@ class HandCenterGestureController:
                 self.drag_start_hand_pos = None
                 self.drag_start_screen_pos = None
                 self.prev_hand_center = None
-                self.smoothed_screen_pos = None
-                self._smoothed_pass2 = None
-                self._prev_raw_pos = None
-                self._last_output_pos = None
+                self._reset_smoothing()
                 self.scroll_reference_y = None
                 self.scroll_accumulated = 0
                 self.scroll_exit_counter = 0
@@ -5579,7 +6208,8 @@ class HandCenterGestureController:
             if _bench is not None:
                 _bench.record(_t0, _t1, _t2, time.perf_counter(),
                               bool(hand_results.multi_hand_landmarks),
-                              self._prev_raw_pos, self._last_output_pos)
+                              self._cursor_state[4:6] if self._cursor_primed else None,
+                              self._cursor_state[6:8] if self._cursor_primed else None)
                 if _bench.done():
                     _p = _bench.save()
                     print(f"[benchmark] complete: {len(_bench.rows)} frames -> {_p}")
@@ -5608,15 +6238,19 @@ class HandCenterGestureController:
             # If errors keep coming for ~2 seconds straight, something is
             # really wrong; show a dialog and exit cleanly.
             if self._tick_error_count >= 60:
-                self._fatal_exit(
-                    S("crash_title"),
-                    "AirPoint kept running into an error while tracking your hand.\n\n"
-                    "Details have been saved to crash.log next to the app.\n"
-                    "Please relaunch AirPoint, and if this keeps happening, email "
-                    "kavinvenkatesanofficial@gmail.com with the crash.log file attached."
-                )
+                self._tracking_failed()
                 return
 
+    def _tracking_failed(self):
+        """Give up after ~2s of consecutive tracking/inference errors."""
+        self._fatal_exit(
+            S("crash_title"),
+            "AirPoint kept running into an error while tracking your hand.\n\n"
+            "Details have been saved to crash.log next to the app.\n"
+            "Please relaunch AirPoint, and if this keeps happening, email "
+            "kavinvenkatesanofficial@gmail.com with the crash.log file attached."
+        )
+
     def run(self):
         """Main control loop using PyQt5 status panel."""
         print("Starting AirPoint controller...")
@@ -5634,6 +6268,12 @@ class HandCenterGestureController:
         app = QApplication.instance() or QApplication(sys.argv)
         apply_app_theme(app)
         app.setWindowIcon(_app_icon())  # window, taskbar/dock and tray glyph
+        # From here on windows can be hidden/minimized to the tray without
+        # quitting - tracking keeps running in the background. The app quits
+        # only via on_quit() (Stop button / tray Stop), which calls app.quit()
+        # explicitly. The setup wizard below runs in a local QEventLoop, so
+        # closing it must not quit the application either.
+        app.setQuitOnLastWindowClosed(False)
 
         # --- Profile selection / calibration phase ---
         # If the user marked a profile as default (Profiles panel), auto-load it
@@ -5653,21 +6293,24 @@ class HandCenterGestureController:
         if self.profile_name is not None and (self.calibration is not None or self.limited_mode or self.kids_mode):
             print(f"Using pre-loaded profile '{self.profile_name}'.")
         else:
+            # Same local-loop pattern as on_recalibrate below: app.exec_() is
+            # entered once, for tracking, instead of once per phase.
             wizard = SetupWizard(self)
+            loop = QEventLoop()
+            wizard.finished.connect(lambda _result: loop.quit())
             wizard.show()
-            app.exec_()
+            loop.exec_()
             if wizard.result == "quit":
                 self.cap.release()
                 raise SystemExit("Quit during setup")
             print(f"Profile '{self.profile_name}' active.")
 
+        self._warm_up()
+        # Nobody read the camera while the picker pages / warm-up ran, so the
+        # driver queue holds stale frames; drop them so tracking starts fresh.
+        self._flush_camera()
+
         # --- Tracking phase with status panel ---
-        # From here the window can be hidden/minimized to the tray without
-        # quitting - tracking keeps running in the background. The app quits only
-        # via on_quit() (Stop button / tray Stop), which calls app.quit()
-        # explicitly. Set this AFTER the setup wizard above, which relies on
-        # app.exec_() returning when its window closes.
-        app.setQuitOnLastWindowClosed(False)
         self._last_gesture = "no_hand"
         panel = StatusPanel(self)
 
@@ -5679,8 +6322,15 @@ class HandCenterGestureController:
         # Tracking timer (~30fps)
         tracking_timer = QTimer()
         tracking_timer.setInterval(16)
+        # Qt's default CoarseTimer may fire up to 5% late, and on Windows it can
+        # fall back to the ~15 ms system tick - that delay lands directly on
+        # every frame's age. A precise timer keeps the 16 ms polling honest.
+        tracking_timer.setTimerType(Qt.PreciseTimer)
         tracking_timer.timeout.connect(self._tracking_tick)
         self._tracking_timer = tracking_timer  # reachable from _fatal_exit in the tick
+        debug_timer = QTimer()
+        debug_timer.setInterval(500)
+        debug_timer.timeout.connect(self._flush_debug_log)
 
         if self._bench_seconds:
             out = self._bench_out or os.path.join(APP_DIR, "bench",
@@ -5691,6 +6341,7 @@ class HandCenterGestureController:
         # Wire up panel buttons
         def on_recalibrate():
             tracking_timer.stop()
+            self._grabber.stop()   # the wizard reads the camera itself
             panel.timer.stop()
             panel.hide()
             # Close the Settings/Profiles window so it can't cover or race the
@@ -5715,8 +6366,12 @@ class HandCenterGestureController:
             if wizard.result == "quit":
                 on_quit()
                 return
+            # The driver kept queueing frames while the wizard was closing;
+            # drop them so the first tracked frame after recalibration is fresh.
+            self._flush_camera()
             panel.show()
             panel.start()
+            self._grabber.start()
             tracking_timer.start()
 
         def on_quit():
@@ -5724,6 +6379,9 @@ class HandCenterGestureController:
             # re-enter on_quit() from inside StatusPanel.closeEvent.
             panel._on_close_quit = None
             tracking_timer.stop()
+            debug_timer.stop()
+            self._flush_debug_log()
+            self._grabber.stop(timeout=1.0)   # fully joined in the cleanup below
             panel.timer.stop()
             panel.close()
             if self.overlay is not None:
@@ -5739,7 +6397,10 @@ class HandCenterGestureController:
 
         panel.show()
         panel.start()
+        self._grabber.start()
         tracking_timer.start()
+        if self.debug:
+            debug_timer.start()
         # Kids profiles boot straight into the practice games.
         if self.kids_mode:
             open_practice_games()
@@ -5752,11 +6413,77 @@ class HandCenterGestureController:
             except Exception:
                 pass
 
+        # No timeout: releasing the device under a reader still inside
+        # cap.read() can crash in the driver.
+        self._grabber.stop()
         self.cap.release()
         if self.overlay is not None:
             self.overlay.close()
         print("AirPoint stopped.")
 
+
+# ---------- Command line ----------
+# airpoint_entry.py (the bundled build) parses its own command line, so the
+# runtime options and what they set on the controller live here, shared by
+# both entry points.
+
+def _camera_size(text):
+    """argparse type for --camera: 'WxH' -> (w, h)."""
+    try:
+        size = tuple(int(v) for v in text.lower().split("x"))
+        if len(size) != 2 or min(size) <= 0:
+            raise ValueError
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"expects WIDTHxHEIGHT, e.g. 640x360 (got '{text}')") from None
+    return size
+
+
+def _add_runtime_args(parser):
+    """Add the camera / tracking tuning options to an entry point's parser.
+    --no-gaze and --dwell are expected to be defined by the caller."""
+    parser.add_argument("--debug", action="store_true",
+                        help="Print a console line for every gesture event (pinch, drag, scroll, clicks)")
+    parser.add_argument("--infer-every", type=int, default=1, metavar="N",
+                        help="Run hand detection on every Nth camera frame and reuse the "
+                             "last landmarks in between (saves CPU on slow machines)")
+    parser.add_argument("--skip-still", action="store_true",
+                        help="Skip hand detection while the camera image is unchanged "
+                             "(resting hand) and reuse the last landmarks")
+    parser.add_argument("--opencl", action="store_true",
+                        help="Resize/convert camera frames on the GPU via OpenCL "
+                             "(can help on integrated graphics; ignored if unavailable)")
+    parser.add_argument("--camera", type=_camera_size, default="1280x720", metavar="WxH",
+                        help="Camera resolution to request (default 1280x720; recalibrate "
+                             "after changing it if the camera crops differently)")
+    parser.add_argument("--camera-fps", type=int, default=None, metavar="FPS",
+                        help="Camera frame rate to request, e.g. 60 (default: the camera's own)")
+    parser.add_argument("--overlay", choices=("off", "minimal", "full"), default="full",
+                        help="What the camera preview draws: the full hand skeleton (default), "
+                             "only the hand center, or nothing")
+
+
+def _controller_from_args(args):
+    """Create the controller and apply --no-gaze / --dwell and the
+    _add_runtime_args options to it (profile loading is left to the caller)."""
+    controller = HandCenterGestureController(enable_gaze_detection=not args.no_gaze,
+                                             camera_size=args.camera,
+                                             camera_fps=args.camera_fps)
+    if args.dwell:
+        controller.dwell_click_enabled = True
+    controller.infer_every = max(1, args.infer_every)
+    controller.skip_still = args.skip_still
+    controller.debug = args.debug
+    controller.overlay_mode = args.overlay
+    if args.opencl:
+        if cv2.ocl.haveOpenCL():
+            cv2.ocl.setUseOpenCL(True)
+            controller._grabber.use_opencl = True
+        else:
+            print("OpenCL not available - frame conversion stays on the CPU.")
+    return controller
+
+
 if __name__ == "__main__":
     # In production (frozen exe), suppress all console output. Open devnull as
     # UTF-8 (errors="replace") so the emoji debug prints can't raise
@@ -5765,9 +6492,6 @@ if __name__ == "__main__":
         sys.stdout = open(os.devnull, "w", encoding="utf-8", errors="replace")
         sys.stderr = open(os.devnull, "w", encoding="utf-8", errors="replace")
 
-    # Install global exception hook so crashes inside Qt event loops also get caught
-    sys.excepthook = show_crash_dialog
-
     parser = argparse.ArgumentParser(description="AirPoint - Gesture-powered mouse controller")
     parser.add_argument("--profile", type=str, default=None,
                         help="Load a saved profile by name (skips profile selector)")
@@ -5783,22 +6507,23 @@ if __name__ == "__main__":
                              "for CPU/RAM. See bench/METHODS.md.")
     parser.add_argument("--benchmark-out", type=str, default=None,
                         help="CSV path for --benchmark (default: bench/trace_<ts>.csv)")
+    _add_runtime_args(parser)
     args = parser.parse_args()
 
     if args.generate_default:
         os.makedirs(PROFILES_DIR, exist_ok=True)
         path = os.path.join(PROFILES_DIR, "default.json")
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(DEFAULT_CONFIG, f, indent=2)
+        _write_json(path, DEFAULT_CONFIG)
         print(f"Default profile written to {path}")
         raise SystemExit(0)
 
-    try:
-        gaze = not args.no_gaze
-        controller = HandCenterGestureController(enable_gaze_detection=gaze)
+    # Install global exception hook so crashes inside Qt event loops also get
+    # caught. Done after --generate-default so that CLI-only path keeps the
+    # plain sys.__excepthook__ text traceback.
+    sys.excepthook = show_crash_dialog
 
-        if args.dwell:
-            controller.dwell_click_enabled = True
+    try:
+        controller = _controller_from_args(args)
 
         if args.benchmark:
             controller._bench_seconds = args.benchmark